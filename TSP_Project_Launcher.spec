@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('help.html', '.')],
-    hiddenimports=['postcode_distance_app', 'tsp_clustering_app', 'calendar_organizer_app', 'smart_scheduler_app', 'pandas', 'requests', 'shapely', 'sklearn', 'scipy', 'matplotlib', 'win32com.client', 'win32timezone'],
+    hiddenimports=['postcode_distance_app', 'tsp_clustering_app', 'calendar_organizer_app', 'smart_scheduler_app', 'pandas', 'requests', 'shapely', 'scipy', 'matplotlib', 'win32com.client', 'win32timezone'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -55,6 +55,34 @@ OUTLOOK_COLORS = {
     24: "DarkPurple"
 }
 
+# Approximate RGB hex values of the Outlook category colors
+OUTLOOK_COLOR_HEX = {
+    1: '#DC143C',   # Red
+    2: '#FF8C00',   # Orange
+    3: '#FFB6C1',   # Peach
+    4: '#FFD700',   # Yellow
+    5: '#32CD32',   # Green
+    6: '#008B8B',   # Teal
+    7: '#808000',   # Olive
+    8: '#4169E1',   # Blue
+    9: '#9370DB',   # Purple
+    10: '#800000',  # Maroon
+    11: '#4682B4',  # Steel
+    12: '#36454F',  # DarkSteel
+    13: '#808080',  # Gray
+    14: '#696969',  # DarkGray
+    15: '#000000',  # Black
+    16: '#8B0000',  # DarkRed
+    17: '#FF4500',  # DarkOrange
+    18: '#CD5C5C',  # DarkPeach
+    19: '#DAA520',  # DarkYellow
+    20: '#006400',  # DarkGreen
+    21: '#008080',  # DarkTeal
+    22: '#556B2F',  # DarkOlive
+    23: '#00008B',  # DarkBlue
+    24: '#483D8B',  # DarkPurple
+}
+
 
 class CalendarOrganizerApp:
     def __init__(self, root, project_dir=None):
@@ -462,34 +490,7 @@ class CalendarOrganizerApp:
     
     def outlook_color_to_matplotlib(self, color_code):
         """Convert Outlook color code to RGB hex color for matplotlib/tkinter"""
-        # Approximate mapping of Outlook colors to RGB hex values
-        color_map = {
-            1: '#DC143C',   # Red
-            2: '#FF8C00',   # Orange
-            3: '#FFB6C1',   # Peach
-            4: '#FFD700',   # Yellow
-            5: '#32CD32',   # Green
-            6: '#008B8B',   # Teal
-            7: '#808000',   # Olive
-            8: '#4169E1',   # Blue
-            9: '#9370DB',   # Purple
-            10: '#800000',  # Maroon
-            11: '#4682B4',  # Steel
-            12: '#36454F',  # DarkSteel
-            13: '#808080',  # Gray
-            14: '#696969',  # DarkGray
-            15: '#000000',  # Black
-            16: '#8B0000',  # DarkRed
-            17: '#FF4500',  # DarkOrange
-            18: '#CD5C5C',  # DarkPeach
-            19: '#DAA520',  # DarkYellow
-            20: '#006400',  # DarkGreen
-            21: '#008080',  # DarkTeal
-            22: '#556B2F',  # DarkOlive
-            23: '#00008B',  # DarkBlue
-            24: '#483D8B',  # DarkPurple
-        }
-        return color_map.get(color_code, '#DC143C')  # Default to Red
+        return OUTLOOK_COLOR_HEX.get(color_code, '#DC143C')  # Default to Red
     
     def on_date_clicked(self, date_str):
         """Handle date click"""
@@ -1,9 +1,13 @@
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import sys
 import os
+import csv
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from contextlib import contextmanager
 from pathlib import Path
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -62,6 +66,77 @@ OUTLOOK_COLORS = {
     24: "DarkPurple"
 }
 
+# Approximate RGB hex values of the Outlook category colors
+OUTLOOK_COLOR_HEX = {
+    1: '#DC143C',   # Red
+    2: '#FF8C00',   # Orange
+    3: '#FFB6C1',   # Peach
+    4: '#FFD700',   # Yellow
+    5: '#32CD32',   # Green
+    6: '#008B8B',   # Teal
+    7: '#808000',   # Olive
+    8: '#4169E1',   # Blue
+    9: '#9370DB',   # Purple
+    10: '#800000',  # Maroon
+    11: '#4682B4',  # Steel
+    12: '#36454F',  # DarkSteel
+    13: '#808080',  # Gray
+    14: '#696969',  # DarkGray
+    15: '#000000',  # Black
+    16: '#8B0000',  # DarkRed
+    17: '#FF4500',  # DarkOrange
+    18: '#CD5C5C',  # DarkPeach
+    19: '#DAA520',  # DarkYellow
+    20: '#006400',  # DarkGreen
+    21: '#008080',  # DarkTeal
+    22: '#556B2F',  # DarkOlive
+    23: '#00008B',  # DarkBlue
+    24: '#483D8B',  # DarkPurple
+}
+
+# Outlook category used for appointments of each color code
+OUTLOOK_CATEGORY_NAMES = {code: f"Appointment - {name}" for code, name in OUTLOOK_COLORS.items()}
+DEFAULT_OUTLOOK_CATEGORY = "Appointment - Red"
+
+# Column types of confirmed_appointments.csv (nullable types, as older files may have gaps)
+APPOINTMENTS_CSV_DTYPES = {
+    'postcode': str,
+    'date': str,
+    'time': str,
+    'duration': 'Int16',  # Minutes
+    'in_outlook': 'boolean'
+}
+
+# Timetable canvas geometry (pixels)
+TIMETABLE_DATE_COL_WIDTH = 110
+TIMETABLE_SLOT_WIDTH = 60  # One 30-minute time slot
+TIMETABLE_HEADER_HEIGHT = 36
+TIMETABLE_ROW_HEIGHT = 48
+TIMETABLE_ROW_BUFFER = 10  # Rows drawn beyond each edge of the visible area
+
+# Timetable colors (also used by the legend)
+TIMETABLE_HEADER_COLOR = '#2C5F8D'
+TIMETABLE_DATE_COLOR = '#E8E8E8'
+TIMETABLE_GRID_COLOR = '#A0A0A0'
+CONFIRMED_COLOR = '#90EE90'  # Light green
+PENDING_COLOR = '#228B22'  # Forest green (darker)
+TRAVEL_TO_APPT_COLOR = '#FFD700'  # Gold
+TRAVEL_FROM_HOME_COLOR = '#87CEEB'  # Sky blue
+TRAVEL_TO_HOME_COLOR = '#FFA500'  # Orange
+CONFLICT_COLOR = '#FF0000'  # Red
+
+
+def travel_overlap_mask(seg_starts, seg_ends, appt_starts, appt_ends):
+    """Return a (segments x appointments) boolean array, True where a travel segment overlaps an appointment.
+    All arguments are 1-D arrays of minutes from midnight."""
+    return (seg_starts[:, None] < appt_ends[None, :]) & (seg_ends[:, None] > appt_starts[None, :])
+
+
+def covered_slot_mask(slot_starts, appt_starts, appt_ends):
+    """Return a boolean array over slots, True where the slot is covered by an appointment that
+    started in an earlier slot. All arguments are 1-D arrays of minutes from midnight."""
+    return ((slot_starts[:, None] > appt_starts[None, :]) & (slot_starts[:, None] < appt_ends[None, :])).any(axis=1)
+
 
 class SmartSchedulerApp:
     def __init__(self, root, project_dir=None):
@@ -78,8 +153,15 @@ class SmartSchedulerApp:
         self.regions_df = None
         self.schedule_df = None
         self.distances_df = None
+        self.travel_time_lookup = {}  # {(origin, destination): minutes} - both directions, built from distances_df
         self.region_names_df = None
         self.clustered_regions_df = None
+        self.postcode_regions = {}  # {postcode: region} - built from clustered_regions_df
+        self.region_color_codes = {}  # {region: Outlook color code} - built from region_names_df
+        self.location_details = {}  # {POSTCODE: (client_name or None, region or None)} - for Outlook appointment text
+        self.region_locations_text = {}  # {region: 'Locations in Region N' body text} - for Outlook appointment text
+        self.known_postcodes_upper = set()  # {POSTCODE} - for display_text_to_postcode
+        self.client_name_postcodes = {}  # {CLIENT NAME: POSTCODE} - for display_text_to_postcode
         self.home_postcode = None  # Home base postcode
         
         # Current selection
@@ -87,11 +169,33 @@ class SmartSchedulerApp:
         self.selected_dates = []
         self.region_postcodes = []  # Postcodes in selected region
         self.appointments = {}  # {(date, time_slot): 'postcode'} - temporary/visual only
+        self.appointments_by_date = {}  # {date: {time_slot: 'postcode'}} - index of self.appointments
         self.pending_appointment = None  # Staged appointment: (date, time, postcode, duration) before submit
-        self.confirmed_appointments = {}  # Confirmed appointments: {postcode: (date, time, duration)} from CSV
-        self.travel_segments = []  # List of (date, start_minutes, end_minutes, info_dict)
+        self.confirmed_appointments = {}  # Confirmed appointments: {postcode: (date, time, duration, in_outlook)} - written back to CSV by flush_appointments_csv
+        self.appointments_flush_id = None  # Pending debounced CSV write (after() id)
+        self.appointments_csv_appends = []  # Postcodes to append to the CSV at the next write
+        self.appointments_csv_rewrite = False  # True if the next write must rewrite the whole CSV
+        self.travel_segments = {}  # {date: [(start_minutes, end_minutes, info_dict), ...]}
+        self.travel_cache = {}  # {date: (signature, segments, boundary_conflicts)} - last recalculation per date
         self.conflicting_segments = set()  # Set of (date, start_minutes, end_minutes) tuples for conflicts
         
+        # Deferred display work, flushed once when the outermost batch_updates() block exits
+        self.batch_depth = 0
+        self.queued_recalc_dates = set()
+        self.timetable_update_queued = False
+        self.region_update_queued = False
+        self.travel_times_display_queued = False
+        
+        # Timetable rows currently drawn on the canvas: (first, last) or None
+        self.rendered_timetable_rows = None
+        self.timetable_render_id = None
+        
+        # Pending debounced refresh after a postcode selection (after() id)
+        self.postcode_refresh_id = None
+        
+        # Appointment confirmation dialog, built on first use and hidden between submissions
+        self.submit_dialog = None
+        
         # Timetable configuration
         self.start_hour = 8
         self.end_hour = 19
@@ -125,12 +229,27 @@ class SmartSchedulerApp:
         # Display preference UI variable
         self.show_names_var = tk.BooleanVar(value=False)
         
+        # Fonts shared by every timetable cell, so Tk resolves each font once
+        self.font_timetable_header = tkfont.Font(family='Arial', size=10, weight='bold')
+        self.font_timetable_label = tkfont.Font(family='Arial', size=9, weight='bold')
+        self.font_timetable_appt = tkfont.Font(family='Arial', size=8, weight='bold')
+        self.font_timetable_travel = tkfont.Font(family='Arial', size=8)
+        
         self.setup_ui()
         
-        # Load project data if available
+        # Write any pending appointment changes before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Load project data if available, drawing the timetable and map once at the end
         if self.project_dir:
-            self.load_project_data()
-            self.load_confirmed_appointments()
+            with self.batch_updates():
+                self.load_project_data()
+                self.load_confirmed_appointments()
+    
+    def on_closing(self):
+        """Handle window close event"""
+        self.flush_appointments_csv()
+        self.root.destroy()
     
     def generate_time_slots(self):
         """Generate time slots based on start and end hours"""
@@ -141,6 +260,9 @@ class SmartSchedulerApp:
             hours = minutes // 60
             mins = minutes % 60
             self.time_slots.append(f"{hours}:{mins:02d}")
+        # Start of each slot in minutes from midnight
+        self.slot_minutes = np.arange(start_time, end_time, 30)
+        self.slot_label_minutes = dict(zip(self.time_slots, range(start_time, end_time, 30)))  # {'9:30': 570}
     
     def toggle_display_preference(self):
         """Toggle between showing names and postcodes"""
@@ -184,24 +306,10 @@ class SmartSchedulerApp:
     
     def get_location_display(self, postcode):
         """Get formatted location for display from a postcode
-        Looks up client_name in clustered_regions_df if available
+        Looks up client_name from clustered_regions_df (see build_location_details)
         Returns the formatted display string"""
-        if self.clustered_regions_df is None:
-            return self.format_postcode_display(postcode)[0]
-        
-        postcode_row = self.clustered_regions_df[self.clustered_regions_df['postcode'] == postcode]
-        if len(postcode_row) > 0:
-            row = postcode_row.iloc[0]
-            client_name = row.get('client_name', None) if hasattr(row, 'get') else (row['client_name'] if 'client_name' in row.index else None)
-            if client_name and pd.notna(client_name):
-                client_name = str(client_name).strip()
-                if not client_name:
-                    client_name = None
-            else:
-                client_name = None
-            return self.format_postcode_display(postcode, client_name)[0]
-        
-        return self.format_postcode_display(postcode)[0]
+        client_name = self.location_details.get(str(postcode).strip().upper(), (None, None))[0]
+        return self.format_postcode_display(postcode, client_name)[0]
     
     def update_all_displays(self):
         """Update all postcode displays after preference change"""
@@ -210,15 +318,7 @@ class SmartSchedulerApp:
             if self.selected_region and self.clustered_regions_df is not None:
                 region_data = self.clustered_regions_df[self.clustered_regions_df['region'] == self.selected_region]
                 self.region_postcodes = sorted(region_data['postcode'].unique().tolist())
-                display_list = []
-                for pc in self.region_postcodes:
-                    row = region_data[region_data['postcode'] == pc].iloc[0] if len(region_data[region_data['postcode'] == pc]) > 0 else None
-                    if row is not None and 'client_name' in region_data.columns:
-                        display_text = self.format_postcode_display(pc, row.get('client_name'))[0]
-                    else:
-                        display_text = self.format_postcode_display(pc)[0]
-                    display_list.append(display_text)
-                self.postcode_combo['values'] = display_list
+                self.postcode_combo['values'] = [self.get_location_display(pc) for pc in self.region_postcodes]
             
             # Redraw timetable
             self.update_timetable()
@@ -330,34 +430,7 @@ class SmartSchedulerApp:
     
     def outlook_color_to_rgb(self, color_code):
         """Convert Outlook color code to RGB hex color"""
-        # Approximate mapping of Outlook colors to RGB hex values
-        color_map = {
-            1: '#DC143C',   # Red
-            2: '#FF8C00',   # Orange
-            3: '#FFB6C1',   # Peach
-            4: '#FFD700',   # Yellow
-            5: '#32CD32',   # Green
-            6: '#008B8B',   # Teal
-            7: '#808000',   # Olive
-            8: '#4169E1',   # Blue
-            9: '#9370DB',   # Purple
-            10: '#800000',  # Maroon
-            11: '#4682B4',  # Steel
-            12: '#36454F',  # DarkSteel
-            13: '#808080',  # Gray
-            14: '#696969',  # DarkGray
-            15: '#000000',  # Black
-            16: '#8B0000',  # DarkRed
-            17: '#FF4500',  # DarkOrange
-            18: '#CD5C5C',  # DarkPeach
-            19: '#DAA520',  # DarkYellow
-            20: '#006400',  # DarkGreen
-            21: '#008080',  # DarkTeal
-            22: '#556B2F',  # DarkOlive
-            23: '#00008B',  # DarkBlue
-            24: '#483D8B',  # DarkPurple
-        }
-        return color_map.get(color_code, '#32CD32')  # Default to Green
+        return OUTLOOK_COLOR_HEX.get(color_code, '#32CD32')  # Default to Green
     
     def lighten_color(self, hex_color, factor=0.6):
         """Lighten a hex color by blending with white"""
@@ -495,16 +568,22 @@ class SmartSchedulerApp:
         h_scrollbar = ttk.Scrollbar(timetable_frame, orient=tk.HORIZONTAL, command=canvas.xview)
         h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        def on_timetable_yscroll(first, last):
+            v_scrollbar.set(first, last)
+            self.on_timetable_viewport_change()
         
-        # Frame inside canvas for timetable
-        self.timetable_inner_frame = ttk.Frame(canvas)
-        canvas_window = canvas.create_window((0, 0), window=self.timetable_inner_frame, anchor='nw')
+        canvas.configure(yscrollcommand=on_timetable_yscroll, xscrollcommand=h_scrollbar.set)
         
-        def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox('all'))
+        # The timetable is drawn directly on the canvas, rows are drawn as they scroll into view
+        canvas.bind('<Configure>', self.on_timetable_viewport_change)
+        canvas.bind('<MouseWheel>', lambda e: canvas.yview_scroll(int(-e.delta / 120), 'units'))
         
-        self.timetable_inner_frame.bind('<Configure>', configure_scroll_region)
+        # One click handler for the whole timetable, cells are found from the click position
+        canvas.bind('<Button-1>', self.on_timetable_click)
+        
+        # Show the hand cursor over clickable cells
+        canvas.tag_bind('cell', '<Enter>', lambda e: canvas.config(cursor='hand2'))
+        canvas.tag_bind('cell', '<Leave>', lambda e: canvas.config(cursor=''))
         
         self.canvas = canvas
         
@@ -536,32 +615,32 @@ class SmartSchedulerApp:
         ttk.Label(legend_frame, text="Legend:", font=('Arial', 9, 'bold')).pack(side=tk.LEFT, padx=(0, 10))
         
         # Confirmed Appointment color
-        appt_canvas = tk.Canvas(legend_frame, width=20, height=15, bg='#90EE90', highlightthickness=1, highlightbackground='black')
+        appt_canvas = tk.Canvas(legend_frame, width=20, height=15, bg=CONFIRMED_COLOR, highlightthickness=1, highlightbackground='black')
         appt_canvas.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(legend_frame, text="Confirmed", font=('Arial', 8)).pack(side=tk.LEFT, padx=(0, 15))
         
         # Pending Appointment color
-        pending_canvas = tk.Canvas(legend_frame, width=20, height=15, bg='#228B22', highlightthickness=1, highlightbackground='black')
+        pending_canvas = tk.Canvas(legend_frame, width=20, height=15, bg=PENDING_COLOR, highlightthickness=1, highlightbackground='black')
         pending_canvas.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(legend_frame, text="Pending", font=('Arial', 8)).pack(side=tk.LEFT, padx=(0, 15))
         
         # Travel to appointment color
-        travel_appt_canvas = tk.Canvas(legend_frame, width=20, height=15, bg='#FFD700', highlightthickness=1, highlightbackground='black')
+        travel_appt_canvas = tk.Canvas(legend_frame, width=20, height=15, bg=TRAVEL_TO_APPT_COLOR, highlightthickness=1, highlightbackground='black')
         travel_appt_canvas.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(legend_frame, text="Travel (to appt)", font=('Arial', 8)).pack(side=tk.LEFT, padx=(0, 15))
         
         # Travel from home color
-        travel_from_home_canvas = tk.Canvas(legend_frame, width=20, height=15, bg='#87CEEB', highlightthickness=1, highlightbackground='black')
+        travel_from_home_canvas = tk.Canvas(legend_frame, width=20, height=15, bg=TRAVEL_FROM_HOME_COLOR, highlightthickness=1, highlightbackground='black')
         travel_from_home_canvas.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(legend_frame, text="Travel (from home)", font=('Arial', 8)).pack(side=tk.LEFT, padx=(0, 15))
         
         # Travel home color
-        travel_home_canvas = tk.Canvas(legend_frame, width=20, height=15, bg='#FFA500', highlightthickness=1, highlightbackground='black')
+        travel_home_canvas = tk.Canvas(legend_frame, width=20, height=15, bg=TRAVEL_TO_HOME_COLOR, highlightthickness=1, highlightbackground='black')
         travel_home_canvas.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(legend_frame, text="Travel (to home)", font=('Arial', 8)).pack(side=tk.LEFT, padx=(0, 15))
         
         # Conflict color
-        conflict_canvas = tk.Canvas(legend_frame, width=20, height=15, bg='#FF0000', highlightthickness=1, highlightbackground='black')
+        conflict_canvas = tk.Canvas(legend_frame, width=20, height=15, bg=CONFLICT_COLOR, highlightthickness=1, highlightbackground='black')
         conflict_canvas.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(legend_frame, text="Conflict", font=('Arial', 8)).pack(side=tk.LEFT)
         
@@ -628,6 +707,10 @@ class SmartSchedulerApp:
             distances_path = os.path.join(self.project_dir, "distances.csv")
             if os.path.exists(distances_path):
                 self.distances_df = pd.read_csv(distances_path)
+                self.build_travel_time_lookup()
+            
+            self.build_region_color_lookup()
+            self.build_location_details()
             
             # Populate region dropdown
             if self.region_names_df is not None and self.schedule_df is not None:
@@ -667,23 +750,22 @@ class SmartSchedulerApp:
             self.generate_time_slots()
             
             # Rebuild appointments and travel segments from confirmed appointments
-            self.appointments.clear()
+            self.clear_appointments()
             self.travel_segments.clear()
             
             # Repopulate appointments from confirmed appointments
             for postcode, (date, time, duration, in_outlook) in self.confirmed_appointments.items():
                 cell_key = (date, time)
-                self.appointments[cell_key] = postcode
+                self.add_appointment(cell_key, postcode)
             
             # Also add pending appointment if exists
             if self.pending_appointment:
                 pending_date, pending_time, pending_postcode, pending_duration = self.pending_appointment
                 cell_key = (pending_date, pending_time)
-                self.appointments[cell_key] = pending_postcode
+                self.add_appointment(cell_key, pending_postcode)
             
             # Recalculate travel times for all dates with appointments
-            dates_with_appointments = set([date for (date, time) in self.appointments.keys()])
-            for date in dates_with_appointments:
+            for date in list(self.appointments_by_date):
                 self.recalculate_travel_times(date)
             
             self.update_timetable()
@@ -713,20 +795,7 @@ class SmartSchedulerApp:
             self.region_postcodes = sorted(region_data['postcode'].unique().tolist())
             
             # Format display with names or postcodes
-            display_list = []
-            for pc in self.region_postcodes:
-                pc_row = region_data[region_data['postcode'] == pc]
-                if len(pc_row) > 0:
-                    client_name = pc_row.iloc[0].get('client_name', None) if hasattr(pc_row.iloc[0], 'get') else (pc_row.iloc[0]['client_name'] if 'client_name' in pc_row.iloc[0] else None)
-                    if client_name and pd.notna(client_name):
-                        client_name = str(client_name).strip()
-                        if not client_name:
-                            client_name = None
-                    else:
-                        client_name = None
-                    display_list.append(self.get_location_display(pc))
-                else:
-                    display_list.append(self.get_location_display(pc))
+            display_list = [self.get_location_display(pc) for pc in self.region_postcodes]
             
             self.postcode_combo['values'] = display_list
             if self.region_postcodes:
@@ -736,8 +805,8 @@ class SmartSchedulerApp:
         optimal_days = self.calculate_optimal_days()
         
         # Update timetable
-        self.update_timetable()
-        self.update_region_visualization()
+        self.queue_timetable_update()
+        self.queue_region_update()
         
         # Update travel times display for the first postcode
         if self.region_postcodes:
@@ -812,11 +881,7 @@ class SmartSchedulerApp:
         for date_idx, date in enumerate(sorted_dates):
             appointments = appointments_by_date[date]
             # Sort by time - convert time strings to minutes for proper sorting
-            def time_to_minutes(time_str):
-                parts = time_str.split(':')
-                return int(parts[0]) * 60 + int(parts[1])
-            
-            appointments.sort(key=lambda x: time_to_minutes(x[0]))
+            appointments.sort(key=lambda x: self.time_to_minutes(x[0]))
             postcodes_ordered = [pc for _, pc, _ in appointments]
             
             # Get color for this date
@@ -915,288 +980,415 @@ class SmartSchedulerApp:
         self.viz_canvas.draw()
     
     def update_timetable(self):
-        """Create/update the timetable grid"""
-        # Clear existing timetable
-        for widget in self.timetable_inner_frame.winfo_children():
-            widget.destroy()
+        """Create/update the timetable grid.
+        The grid is drawn directly on the timetable canvas. Only rows in or near the visible
+        area are drawn; the rest are drawn as they are scrolled into view."""
+        canvas = self.canvas
+        canvas.delete('all')
+        self.rendered_timetable_rows = None
         
         if not self.selected_dates:
-            ttk.Label(self.timetable_inner_frame, text="No dates available for selected region",
-                     font=('Arial', 12)).grid(row=0, column=0, padx=20, pady=20)
+            canvas.create_text(20, 20, text="No dates available for selected region",
+                               font=('Arial', 12), anchor='nw')
+            canvas.configure(scrollregion=canvas.bbox('all'))
             return
         
+        # Every row has the same height, so the full scroll region is known without drawing the rows
+        width = TIMETABLE_DATE_COL_WIDTH + len(self.time_slots) * TIMETABLE_SLOT_WIDTH
+        height = TIMETABLE_HEADER_HEIGHT + len(self.selected_dates) * TIMETABLE_ROW_HEIGHT
+        canvas.configure(scrollregion=(0, 0, width, height))
+        
         # Create header row
         # Date column header
-        date_header = tk.Label(self.timetable_inner_frame, text="Date", bg='#2C5F8D', fg='white',
-                              font=('Arial', 10, 'bold'), width=15, height=2, relief=tk.RIDGE, bd=1)
-        date_header.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        canvas.create_rectangle(0, 0, TIMETABLE_DATE_COL_WIDTH, TIMETABLE_HEADER_HEIGHT,
+                                fill=TIMETABLE_HEADER_COLOR, outline=TIMETABLE_GRID_COLOR)
+        canvas.create_text(TIMETABLE_DATE_COL_WIDTH / 2, TIMETABLE_HEADER_HEIGHT / 2, text="Date",
+                           fill='white', font=self.font_timetable_header)
         
         # Time slot headers
-        for col, time_slot in enumerate(self.time_slots, start=1):
-            time_label = tk.Label(self.timetable_inner_frame, text=time_slot, bg='#2C5F8D', fg='white',
-                                 font=('Arial', 9, 'bold'), width=8, height=2, relief=tk.RIDGE, bd=1)
-            time_label.grid(row=0, column=col, sticky=(tk.W, tk.E, tk.N, tk.S))
+        for col, time_slot in enumerate(self.time_slots):
+            x0 = TIMETABLE_DATE_COL_WIDTH + col * TIMETABLE_SLOT_WIDTH
+            canvas.create_rectangle(x0, 0, x0 + TIMETABLE_SLOT_WIDTH, TIMETABLE_HEADER_HEIGHT,
+                                    fill=TIMETABLE_HEADER_COLOR, outline=TIMETABLE_GRID_COLOR)
+            canvas.create_text(x0 + TIMETABLE_SLOT_WIDTH / 2, TIMETABLE_HEADER_HEIGHT / 2, text=time_slot,
+                               fill='white', font=self.font_timetable_label)
+        
+        self.render_visible_timetable_rows()
+    
+    def on_timetable_viewport_change(self, event=None):
+        """Draw newly exposed timetable rows once the current scroll/resize events are processed"""
+        if self.timetable_render_id is None:
+            self.timetable_render_id = self.root.after_idle(self.render_visible_timetable_rows)
+    
+    def render_visible_timetable_rows(self):
+        """Draw the timetable rows in the visible area plus a buffer above and below"""
+        self.timetable_render_id = None
+        if not self.selected_dates:
+            return
         
-        # Create row for each date
-        for row_idx, date in enumerate(self.selected_dates, start=1):
-            # Date label
-            date_str = date.strftime('%d-%b-%y')
-            date_label = tk.Label(self.timetable_inner_frame, text=date_str, bg='#E8E8E8',
-                                 font=('Arial', 9, 'bold'), width=15, height=3, relief=tk.RIDGE, bd=1)
-            date_label.grid(row=row_idx, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        canvas = self.canvas
+        num_rows = len(self.selected_dates)
+        top = canvas.canvasy(0) - TIMETABLE_HEADER_HEIGHT
+        bottom = canvas.canvasy(canvas.winfo_height()) - TIMETABLE_HEADER_HEIGHT
+        visible_first = min(max(0, int(top // TIMETABLE_ROW_HEIGHT)), num_rows)
+        visible_last = min(max(0, int(bottom // TIMETABLE_ROW_HEIGHT) + 1), num_rows)
+        
+        # Nothing to do while the visible rows are still inside the drawn window
+        rendered = self.rendered_timetable_rows
+        if rendered and rendered[0] <= visible_first and visible_last <= rendered[1]:
+            return
+        
+        first = max(0, visible_first - TIMETABLE_ROW_BUFFER)
+        last = min(num_rows, visible_last + TIMETABLE_ROW_BUFFER)
+        
+        # Appointment durations: stored for confirmed, current setting for pending
+        pending_duration = int(self.appointment_duration_var.get())
+        durations = {pc: appt[2] for pc, appt in self.confirmed_appointments.items()}
+        
+        canvas.delete('row')
+        for row_idx in range(first, last):
+            self.draw_timetable_row(row_idx, self.selected_dates[row_idx], durations, pending_duration)
+        self.rendered_timetable_rows = (first, last)
+    
+    def draw_timetable_row(self, row_idx, date, durations, pending_duration):
+        """Draw the date label and time slot cells for one timetable row.
+        durations maps confirmed postcodes to their duration; anything else uses pending_duration."""
+        canvas = self.canvas
+        y0 = TIMETABLE_HEADER_HEIGHT + row_idx * TIMETABLE_ROW_HEIGHT
+        y1 = y0 + TIMETABLE_ROW_HEIGHT
+        y_mid = (y0 + y1) / 2
+        
+        # Date label
+        date_str = date.strftime('%d-%b-%y')
+        canvas.create_rectangle(0, y0, TIMETABLE_DATE_COL_WIDTH, y1, fill=TIMETABLE_DATE_COLOR,
+                                outline=TIMETABLE_GRID_COLOR, tags='row')
+        canvas.create_text(TIMETABLE_DATE_COL_WIDTH / 2, y_mid, text=date_str,
+                           font=self.font_timetable_label, tags='row')
+        
+        # Slots covered by an appointment that starts in an earlier slot are not drawn
+        date_appointments = self.appointments_by_date.get(date_str, {})
+        appt_starts = np.fromiter((self.time_to_minutes(t) for t in date_appointments),
+                                  dtype=np.int64, count=len(date_appointments))
+        appt_ends = appt_starts + np.fromiter((durations.get(pc, pending_duration) for pc in date_appointments.values()),
+                                              dtype=np.int64, count=len(date_appointments))
+        on_grid = np.isin(appt_starts, self.slot_minutes)
+        covered = covered_slot_mask(self.slot_minutes, appt_starts[on_grid], appt_ends[on_grid])
+        
+        # Time slot cells
+        appointment_cells = []  # (x0, x1, bg_color, text, font)
+        empty_cols = set()  # 0-based columns drawn as empty cells
+        for col_idx, time_slot in enumerate(self.time_slots, start=1):
+            cell_key = (date_str, time_slot)
+            x0 = TIMETABLE_DATE_COL_WIDTH + (col_idx - 1) * TIMETABLE_SLOT_WIDTH
+            
+            if covered[col_idx - 1]:
+                # Skip this cell as it's covered by a previous appointment's span
+                continue
             
-            # Time slot cells
-            for col_idx, time_slot in enumerate(self.time_slots, start=1):
-                cell_key = (date_str, time_slot)
+            # Clicks are handled for the whole canvas by on_timetable_click
+            cell_tags = ('row', 'cell')
+            
+            # Check if there's an appointment starting at this time
+            if cell_key in self.appointments:
+                # Appointment cell - check if confirmed or pending
+                postcode = self.appointments[cell_key]
                 
-                # Convert time slot to minutes from midnight
-                slot_start_minutes = self.time_to_minutes(time_slot)
-                slot_end_minutes = slot_start_minutes + 30
+                # Format display with name or postcode
+                display_postcode = self.get_location_display(postcode)
                 
-                # Check if this cell is covered by a previous appointment (skip rendering it)
-                is_covered = False
+                if postcode in self.confirmed_appointments:
+                    bg_color = CONFIRMED_COLOR
+                    in_outlook = self.confirmed_appointments[postcode][3]
+                    # Add email indicator if synced to Outlook
+                    display_text = f"{display_postcode} ✉" if in_outlook else display_postcode
+                else:
+                    bg_color = PENDING_COLOR
+                    in_outlook = False
+                    display_text = display_postcode
                 
-                # Check previous slots to see if any appointment covers this slot
-                for check_col in range(1, col_idx):
-                    check_time_slot = self.time_slots[check_col - 1]  # -1 because col_idx starts at 1
-                    check_cell_key = (date_str, check_time_slot)
-                    
-                    if check_cell_key in self.appointments:
-                        check_postcode = self.appointments[check_cell_key]
-                        # Get the actual duration of this appointment
-                        if check_postcode in self.confirmed_appointments:
-                            _, _, check_duration, _ = self.confirmed_appointments[check_postcode]
-                        else:
-                            check_duration = int(self.appointment_duration_var.get())
-                        
-                        # Check if this appointment extends to cover the current slot
-                        appt_start_minutes = self.time_to_minutes(check_time_slot)
-                        appt_end_minutes = appt_start_minutes + check_duration
-                        
-                        if slot_start_minutes < appt_end_minutes:
-                            is_covered = True
-                            break
+                # Calculate span based on appointment duration (30-minute slots)
+                duration_minutes = durations.get(postcode, pending_duration)
+                columnspan = duration_minutes // 30  # Each column is 30 minutes
+                x1 = x0 + columnspan * TIMETABLE_SLOT_WIDTH
                 
-                if is_covered:
-                    # Skip this cell as it's covered by a previous appointment's columnspan
-                    continue
+                # Use larger font size if Outlook indicator is present for better visibility
+                font = self.font_timetable_label if in_outlook else self.font_timetable_appt
                 
-                # Check if there's an appointment starting at this time
-                if cell_key in self.appointments:
-                    # Appointment cell - check if confirmed or pending
-                    postcode = self.appointments[cell_key]
-                    
-                    # Format display with name or postcode
-                    display_postcode = self.get_location_display(postcode)
-                    
-                    # Get duration - use stored duration for confirmed appointments, current setting for pending
-                    if postcode in self.confirmed_appointments:
-                        bg_color = '#90EE90'  # Light green for confirmed
-                        # Get stored duration from confirmed appointments
-                        _, _, duration_minutes, in_outlook = self.confirmed_appointments[postcode]
-                        # Add email indicator if synced to Outlook
-                        display_text = f"{display_postcode} ✉" if in_outlook else display_postcode
-                    else:
-                        bg_color = '#228B22'  # Forest green for pending (darker)
-                        # Use current duration setting for pending appointments
-                        duration_minutes = int(self.appointment_duration_var.get())
-                        display_text = display_postcode
-                    
-                    # Calculate columnspan based on appointment duration (30-minute slots)
-                    columnspan = duration_minutes // 30  # Each column is 30 minutes
-                    
-                    # Use larger font size if Outlook indicator is present for better visibility
-                    font_size = 9 if (postcode in self.confirmed_appointments and self.confirmed_appointments[postcode][3]) else 8
-                    
-                    cell = tk.Label(self.timetable_inner_frame, text=display_text, bg=bg_color,
-                                   font=('Arial', font_size, 'bold'), width=8, height=3, relief=tk.RIDGE, bd=1,
-                                   cursor='hand2', anchor='center', justify='center', wraplength=60)
-                    cell.grid(row=row_idx, column=col_idx, columnspan=columnspan, sticky=(tk.W, tk.E, tk.N, tk.S))
-                    cell.bind('<Button-1>', lambda e, d=date_str, t=time_slot: self.on_cell_click(d, t))
-                    
-                else:
-                    # Check if any travel segments overlap this time slot
-                    overlapping_segments = []
-                    for seg_date, seg_start, seg_end, seg_info in self.travel_segments:
-                        if seg_date == date_str and seg_start < slot_end_minutes and seg_end > slot_start_minutes:
-                            overlapping_segments.append((seg_start, seg_end, seg_info))
-                    
-                    if overlapping_segments:
-                        # Create a canvas for custom drawing
-                        cell_canvas = tk.Canvas(self.timetable_inner_frame, width=60, height=45, 
-                                               relief=tk.RIDGE, bd=1, highlightthickness=0)
-                        cell_canvas.grid(row=row_idx, column=col_idx, sticky=(tk.W, tk.E, tk.N, tk.S))
-                        
-                        # Draw white background
-                        cell_canvas.create_rectangle(0, 0, 60, 45, fill='white', outline='')
-                        
-                        # Draw each overlapping segment
-                        for seg_start, seg_end, seg_info in overlapping_segments:
-                            # Calculate overlap within this slot
-                            overlap_start = max(seg_start, slot_start_minutes)
-                            overlap_end = min(seg_end, slot_end_minutes)
-                            
-                            # Calculate pixel positions (0-60 for the 30-minute slot)
-                            start_pixel = int(((overlap_start - slot_start_minutes) / 30.0) * 60)
-                            end_pixel = int(((overlap_end - slot_start_minutes) / 30.0) * 60)
-                            
-                            # Determine color - red if conflicting, otherwise normal colors
-                            is_conflicting = (date_str, seg_start, seg_end) in self.conflicting_segments
-                            
-                            if is_conflicting:
-                                travel_color = '#FF0000'  # Red for conflicts
-                            elif seg_info['to_home']:
-                                travel_color = '#FFA500'  # Orange
-                            elif seg_info.get('from_home', False):
-                                travel_color = '#87CEEB'  # Sky blue
-                            else:
-                                travel_color = '#FFD700'  # Gold
-                            
-                            # Draw colored rectangle
-                            cell_canvas.create_rectangle(start_pixel, 0, end_pixel, 45, 
-                                                        fill=travel_color, outline='')
-                            
-                            # Add text in the slot immediately adjacent to the appointment
-                            total_minutes = seg_end - seg_start
-                            # For travel FROM home: show in the last slot before segment ends (left of appointment)
-                            # For travel TO next/home: show in the first slot where segment starts (right of appointment)
-                            show_text = False
-                            if seg_info.get('from_home', False):
-                                # Show text if this is the last slot before the segment ends
-                                if seg_end > slot_start_minutes and seg_end <= slot_end_minutes:
-                                    show_text = True
-                            else:
-                                # Show text if this is the first slot where the segment starts
-                                if seg_start >= slot_start_minutes and seg_start < slot_end_minutes:
-                                    show_text = True
-                            
-                            if show_text:
-                                cell_canvas.create_text(30, 22, text=f"Travel\n{total_minutes} min", 
-                                                      font=('Arial', 8), justify='center')
-                        
-                        # Bind click event
-                        cell_canvas.bind('<Button-1>', lambda e, d=date_str, t=time_slot: self.on_cell_click(d, t))
-                        cell_canvas.config(cursor='hand2')
-                    else:
-                        # Empty cell
-                        cell = tk.Label(self.timetable_inner_frame, text="", bg='white',
-                                       font=('Arial', 8), width=8, height=3, relief=tk.RIDGE, bd=1,
-                                       cursor='hand2', anchor='center', justify='center')
-                        cell.grid(row=row_idx, column=col_idx, sticky=(tk.W, tk.E, tk.N, tk.S))
-                        cell.bind('<Button-1>', lambda e, d=date_str, t=time_slot: self.on_cell_click(d, t))
+                # Drawn after the travel segments so appointments sit on top of them
+                appointment_cells.append((x0, x1, bg_color, display_text, font))
+                
+            else:
+                # Empty cell - white background, travel segments are drawn over it below
+                canvas.create_rectangle(x0, y0, x0 + TIMETABLE_SLOT_WIDTH, y1, fill='white', outline=TIMETABLE_GRID_COLOR,
+                                        tags=cell_tags)
+                empty_cols.add(col_idx - 1)
+        
+        # Draw each travel segment as one rectangle over its whole time range
+        num_slots = len(self.time_slots)
+        grid_x0 = TIMETABLE_DATE_COL_WIDTH
+        grid_x1 = grid_x0 + num_slots * TIMETABLE_SLOT_WIDTH
+        day_start_minutes = self.time_to_minutes(self.time_slots[0]) if self.time_slots else 0
+        
+        for seg_start, seg_end, seg_info in self.travel_segments.get(date_str, ()):
+            # Determine color - red if conflicting, otherwise normal colors
+            is_conflicting = (date_str, seg_start, seg_end) in self.conflicting_segments
+            
+            if is_conflicting:
+                travel_color = CONFLICT_COLOR
+            elif seg_info['to_home']:
+                travel_color = TRAVEL_TO_HOME_COLOR
+            elif seg_info.get('from_home', False):
+                travel_color = TRAVEL_FROM_HOME_COLOR
+            else:
+                travel_color = TRAVEL_TO_APPT_COLOR
+            
+            # Pixel range of the segment, clipped to the timetable
+            seg_x0 = max(grid_x0, grid_x0 + (seg_start - day_start_minutes) / 30.0 * TIMETABLE_SLOT_WIDTH)
+            seg_x1 = min(grid_x1, grid_x0 + (seg_end - day_start_minutes) / 30.0 * TIMETABLE_SLOT_WIDTH)
+            if seg_x1 <= seg_x0:
+                continue
+            
+            canvas.create_rectangle(seg_x0, y0 + 1, seg_x1, y1 - 1, fill=travel_color, outline='',
+                                    tags=('row', 'cell'))
+            
+            # Add text in the slot immediately adjacent to the appointment
+            # For travel FROM home: the last slot before the segment ends (left of appointment)
+            # For travel TO next/home: the first slot where the segment starts (right of appointment)
+            if seg_info.get('from_home', False):
+                label_col = (seg_end - day_start_minutes - 1) // 30
+            else:
+                label_col = (seg_start - day_start_minutes) // 30
+            
+            if label_col in empty_cols:
+                label_x = grid_x0 + label_col * TIMETABLE_SLOT_WIDTH + TIMETABLE_SLOT_WIDTH / 2
+                canvas.create_text(label_x, y_mid, text=f"Travel\n{seg_end - seg_start} min",
+                                   font=self.font_timetable_travel, justify='center', tags=('row', 'cell'))
+        
+        # Appointment cells
+        for x0, x1, bg_color, display_text, font in appointment_cells:
+            canvas.create_rectangle(x0, y0, x1, y1, fill=bg_color, outline=TIMETABLE_GRID_COLOR, tags=('row', 'cell'))
+            canvas.create_text((x0 + x1) / 2, y_mid, text=display_text, font=font,
+                               justify='center', width=x1 - x0 - 4, tags=('row', 'cell'))
+    
+    def on_timetable_click(self, event):
+        """Map a click on the timetable canvas to its (date, time slot) cell and handle it"""
+        x = self.canvas.canvasx(event.x) - TIMETABLE_DATE_COL_WIDTH
+        y = self.canvas.canvasy(event.y) - TIMETABLE_HEADER_HEIGHT
+        if x < 0 or y < 0:
+            return  # Header row or date column
+        
+        row_idx = int(y // TIMETABLE_ROW_HEIGHT)
+        col_idx = int(x // TIMETABLE_SLOT_WIDTH)
+        if row_idx >= len(self.selected_dates) or col_idx >= len(self.time_slots):
+            return
         
-        # Update scroll region
-        self.timetable_inner_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox('all'))
+        date_str = self.selected_dates[row_idx].strftime('%d-%b-%y')
+        time_slot = self.time_slots[col_idx]
+        
+        # A click inside a multi-slot appointment belongs to the slot the appointment starts in
+        slot_minutes = self.time_to_minutes(time_slot)
+        for appt_time, postcode in self.appointments_by_date.get(date_str, {}).items():
+            appt_start = self.time_to_minutes(appt_time)
+            if postcode in self.confirmed_appointments:
+                duration = self.confirmed_appointments[postcode][2]
+            else:
+                duration = int(self.appointment_duration_var.get())
+            if appt_start <= slot_minutes < appt_start + duration:
+                time_slot = appt_time
+                break
+        
+        self.on_cell_click(date_str, time_slot)
     
     def on_cell_click(self, date_str, time_slot):
         """Handle cell click to stage appointment (not confirmed until submit)"""
-        cell_key = (date_str, time_slot)
-        
-        # If cell already has appointment, remove it
-        if cell_key in self.appointments:
-            postcode = self.appointments[cell_key]
+        # Coalesce travel recalculation and redraws into a single pass
+        with self.batch_updates():
+            cell_key = (date_str, time_slot)
             
-            # Check if it's a confirmed appointment
-            if postcode in self.confirmed_appointments:
-                if self.show_yes_no_dialog("Remove Confirmed Appointment", 
-                                       f"This is a confirmed appointment for {postcode}.\nAre you sure you want to remove it?"):
-                    # Remove from confirmed appointments
-                    del self.confirmed_appointments[postcode]
-                    # Remove from CSV
-                    df = pd.read_csv(self.appointments_csv)
-                    df = df[df['postcode'] != postcode]
-                    df.to_csv(self.appointments_csv, index=False)
-                    
-                    del self.appointments[cell_key]
-                    self.recalculate_travel_times(date_str)
-                    self.update_timetable()
-                    self.update_region_visualization()
-                    self.status_label.config(text=f"Removed confirmed appointment: {postcode}", foreground='orange')
-                    
-                    # Update travel times display
-                    if self.postcode_var.get():
-                        self.display_travel_times(self.postcode_var.get())
-                return
-            else:
-                # Remove pending appointment
-                del self.appointments[cell_key]
-                self.pending_appointment = None
-                self.pending_label.config(text="")
-                self.recalculate_travel_times(date_str)
-                self.update_timetable()
-                self.status_label.config(text=f"Removed pending appointment: {postcode}", foreground='orange')
+            # If cell already has appointment, remove it
+            if cell_key in self.appointments:
+                postcode = self.appointments[cell_key]
+                
+                # Check if it's a confirmed appointment
+                if postcode in self.confirmed_appointments:
+                    if self.show_yes_no_dialog("Remove Confirmed Appointment", 
+                                           f"This is a confirmed appointment for {postcode}.\nAre you sure you want to remove it?"):
+                        # Remove from confirmed appointments
+                        del self.confirmed_appointments[postcode]
+                        # Remove from CSV
+                        self.schedule_appointments_flush()
+                        
+                        self.remove_appointment(cell_key)
+                        self.queue_travel_recalc(date_str)
+                        self.queue_timetable_update()
+                        self.queue_region_update()
+                        self.status_label.config(text=f"Removed confirmed appointment: {postcode}", foreground='orange')
+                        
+                        # Update travel times display
+                        self.queue_travel_times_display()
+                    return
+                else:
+                    # Remove pending appointment
+                    self.remove_appointment(cell_key)
+                    self.pending_appointment = None
+                    self.pending_label.config(text="")
+                    self.queue_travel_recalc(date_str)
+                    self.queue_timetable_update()
+                    self.status_label.config(text=f"Removed pending appointment: {postcode}", foreground='orange')
+                    return
+            
+            # Check if there's already a pending appointment
+            if self.pending_appointment:
+                pending_date, pending_time, pending_postcode, pending_duration = self.pending_appointment
+                response = self.show_yes_no_dialog(
+                    "Replace Pending Appointment?",
+                    f"You already have a pending appointment:\n{pending_postcode} on {pending_date} at {pending_time} ({pending_duration} min)\n\nDo you want to replace it with a new selection?\n\n(Submit the current appointment first to keep it)"
+                )
+                if response:
+                    # Remove old pending appointment
+                    old_key = (pending_date, pending_time)
+                    if old_key in self.appointments:
+                        self.remove_appointment(old_key)
+                    self.pending_appointment = None
+                    self.pending_label.config(text="")
+                    self.queue_travel_recalc(pending_date)
+                    self.queue_timetable_update()
+                else:
+                    # User chose not to replace, do nothing
+                    return
+            
+            # Get selected postcode
+            selected_index = self.postcode_combo.current()
+            if selected_index < 0 or selected_index >= len(self.region_postcodes):
+                self.show_warning_dialog("No Postcode Selected", "Please select a postcode first.")
                 return
-        
-        # Check if there's already a pending appointment
-        if self.pending_appointment:
-            pending_date, pending_time, pending_postcode, pending_duration = self.pending_appointment
-            response = self.show_yes_no_dialog(
-                "Replace Pending Appointment?",
-                f"You already have a pending appointment:\n{pending_postcode} on {pending_date} at {pending_time} ({pending_duration} min)\n\nDo you want to replace it with a new selection?\n\n(Submit the current appointment first to keep it)"
-            )
-            if response:
-                # Remove old pending appointment
-                old_key = (pending_date, pending_time)
-                if old_key in self.appointments:
-                    del self.appointments[old_key]
-                self.pending_appointment = None
-                self.pending_label.config(text="")
-                self.recalculate_travel_times(pending_date)
-                self.update_timetable()
-            else:
-                # User chose not to replace, do nothing
+            
+            postcode = self.region_postcodes[selected_index]
+            
+            # VALIDATION: Check if this postcode already has a confirmed appointment
+            if postcode in self.confirmed_appointments:
+                existing_date, existing_time, _, _ = self.confirmed_appointments[postcode]
+                self.show_error_dialog(
+                    "Duplicate Location",
+                    f"Location {postcode} already has a confirmed appointment on {existing_date} at {existing_time}.\n\nOnly 1 appointment per location is allowed.\n\nPlease remove the existing appointment first if you need to reschedule."
+                )
                 return
-        
-        # Get selected postcode
-        selected_index = self.postcode_combo.current()
-        if selected_index < 0 or selected_index >= len(self.region_postcodes):
-            self.show_warning_dialog("No Postcode Selected", "Please select a postcode first.")
-            return
-        
-        postcode = self.region_postcodes[selected_index]
-        
-        # VALIDATION: Check if this postcode already has a confirmed appointment
-        if postcode in self.confirmed_appointments:
-            existing_date, existing_time, _, _ = self.confirmed_appointments[postcode]
-            self.show_error_dialog(
-                "Duplicate Location",
-                f"Location {postcode} already has a confirmed appointment on {existing_date} at {existing_time}.\n\nOnly 1 appointment per location is allowed.\n\nPlease remove the existing appointment first if you need to reschedule."
-            )
-            return
-        
-        # Temporarily add appointment to check for conflicts
-        self.appointments[cell_key] = postcode
-        self.recalculate_travel_times(date_str)
-        
-        # Check for conflicts
-        conflicts = self.check_travel_conflicts(date_str)
-        
-        if conflicts:
-            conflict_msg = "Note: This appointment creates travel time conflicts:\n\n"
-            for conflict in conflicts:
-                conflict_msg += f"• {conflict}\n"
-            conflict_msg += "\nConflicting travel times are marked in red."
             
-            self.show_info_dialog("Travel Time Conflict", conflict_msg)
+            # Temporarily add appointment to check for conflicts
+            self.add_appointment(cell_key, postcode)
+            self.recalculate_travel_times(date_str)
+            
+            # Check for conflicts
+            conflicts = self.check_travel_conflicts(date_str)
+            
+            if conflicts:
+                conflict_msg = "Note: This appointment creates travel time conflicts:\n\n"
+                for conflict in conflicts:
+                    conflict_msg += f"• {conflict}\n"
+                conflict_msg += "\nConflicting travel times are marked in red."
+                
+                self.show_info_dialog("Travel Time Conflict", conflict_msg)
+            
+            # Stage as pending appointment with current duration setting
+            current_duration = int(self.appointment_duration_var.get())
+            self.pending_appointment = (date_str, time_slot, postcode, current_duration)
+            self.pending_label.config(text=f"Pending: {postcode} on {date_str} at {time_slot} ({current_duration} min)")
+            
+            # Update display
+            self.queue_timetable_update()
+            self.queue_region_update()
+            status_msg = f"Staged appointment: {postcode} on {date_str} at {time_slot} (click Submit to confirm)"
+            if conflicts:
+                status_msg += " (has conflicts)"
+            self.status_label.config(text=status_msg, foreground='orange')
+    
+    @contextmanager
+    def batch_updates(self):
+        """Defer travel recalculation and redraws requested inside the block.
+        The queued work is flushed once, on idle, when the outermost block exits."""
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0:
+                self.root.after_idle(self.flush_queued_updates)
+    
+    def queue_travel_recalc(self, date_str):
+        """Recalculate travel times for a date now, or at the end of the current batch"""
+        if self.batch_depth:
+            self.queued_recalc_dates.add(date_str)
+        else:
+            self.recalculate_travel_times(date_str)
+    
+    def queue_timetable_update(self):
+        """Redraw the timetable now, or at the end of the current batch"""
+        if self.batch_depth:
+            self.timetable_update_queued = True
+        else:
+            self.update_timetable()
+    
+    def queue_region_update(self):
+        """Redraw the region map now, or at the end of the current batch"""
+        if self.batch_depth:
+            self.region_update_queued = True
+        else:
+            self.update_region_visualization()
+    
+    def queue_travel_times_display(self):
+        """Refresh the travel times panel now, or at the end of the current batch"""
+        if self.batch_depth:
+            self.travel_times_display_queued = True
+        elif self.postcode_var.get():
+            self.display_travel_times(self.postcode_var.get())
+    
+    def flush_queued_updates(self):
+        """Run the work queued by batch_updates() - each redraw at most once"""
+        for date_str in list(self.queued_recalc_dates):
+            self.recalculate_travel_times(date_str)
         
-        # Stage as pending appointment with current duration setting
-        current_duration = int(self.appointment_duration_var.get())
-        self.pending_appointment = (date_str, time_slot, postcode, current_duration)
-        self.pending_label.config(text=f"Pending: {postcode} on {date_str} at {time_slot} ({current_duration} min)")
+        if self.timetable_update_queued:
+            self.timetable_update_queued = False
+            self.update_timetable()
+        
+        if self.region_update_queued:
+            self.region_update_queued = False
+            self.update_region_visualization()
         
-        # Update display
-        self.update_timetable()
-        self.update_region_visualization()
-        status_msg = f"Staged appointment: {postcode} on {date_str} at {time_slot} (click Submit to confirm)"
-        if conflicts:
-            status_msg += " (has conflicts)"
-        self.status_label.config(text=status_msg, foreground='orange')
+        if self.travel_times_display_queued:
+            self.travel_times_display_queued = False
+            if self.postcode_var.get():
+                self.display_travel_times(self.postcode_var.get())
     
     def time_to_minutes(self, time_str):
         """Convert time string (HH:MM) to minutes from midnight"""
-        hours, mins = map(int, time_str.split(':'))
-        return hours * 60 + mins
+        # Timetable slot labels are looked up; anything else is parsed
+        minutes = self.slot_label_minutes.get(time_str)
+        if minutes is None:
+            hours, mins = map(int, time_str.split(':'))
+            minutes = hours * 60 + mins
+        return minutes
+    
+    def add_appointment(self, cell_key, postcode):
+        """Add an appointment to the visual appointments dict and its per-date index"""
+        date_str, time_slot = cell_key
+        self.appointments[cell_key] = postcode
+        self.appointments_by_date.setdefault(date_str, {})[time_slot] = postcode
+    
+    def remove_appointment(self, cell_key):
+        """Remove an appointment from the visual appointments dict and its per-date index"""
+        date_str, time_slot = cell_key
+        del self.appointments[cell_key]
+        date_appointments = self.appointments_by_date.get(date_str)
+        if date_appointments is not None:
+            date_appointments.pop(time_slot, None)
+            if not date_appointments:
+                del self.appointments_by_date[date_str]
+    
+    def clear_appointments(self):
+        """Remove all visual appointments"""
+        self.appointments.clear()
+        self.appointments_by_date.clear()
     
     def check_travel_conflicts(self, date_str):
         """Check for conflicts between travel segments and appointments"""
@@ -1205,48 +1397,70 @@ class SmartSchedulerApp:
         
         # Get all appointments for this date with their time ranges
         appt_ranges = []
-        for (d, t), postcode in self.appointments.items():
-            if d == date_str:
-                start_min = self.time_to_minutes(t)
-                # Get actual duration for this appointment
-                if postcode in self.confirmed_appointments:
-                    _, _, duration, _ = self.confirmed_appointments[postcode]
-                else:
-                    duration = int(self.appointment_duration_var.get())
-                end_min = start_min + duration
-                appt_ranges.append((start_min, end_min, t))
-        
-        # Check each travel segment for conflicts with appointments
-        for seg_date, seg_start, seg_end, seg_info in self.travel_segments:
-            if seg_date != date_str:
-                continue
-            
-            # Check if travel overlaps with any appointment
-            for appt_start, appt_end, appt_time in appt_ranges:
-                # Check for overlap: travel and appointment overlap if one starts before the other ends
-                if seg_start < appt_end and seg_end > appt_start:
-                    # Conflict detected
-                    travel_type = "from home" if seg_info.get('from_home') else ("to home" if seg_info['to_home'] else "between appointments")
-                    conflicts.append(f"Travel {travel_type} ({seg_info['minutes']} min) overlaps with appointment at {appt_time}")
-                    self.conflicting_segments.add((seg_date, seg_start, seg_end))
+        for t, postcode in self.appointments_by_date.get(date_str, {}).items():
+            start_min = self.time_to_minutes(t)
+            # Get actual duration for this appointment
+            if postcode in self.confirmed_appointments:
+                _, _, duration, _ = self.confirmed_appointments[postcode]
+            else:
+                duration = int(self.appointment_duration_var.get())
+            end_min = start_min + duration
+            appt_ranges.append((start_min, end_min, t))
+        
+        date_segments = self.travel_segments.get(date_str, ())
+        if not appt_ranges or not date_segments:
+            return conflicts
+        
+        # Check every travel segment against every appointment in one pass
+        seg_bounds = np.array([(seg_start, seg_end) for seg_start, seg_end, _ in date_segments], dtype=np.int64)
+        appt_bounds = np.array([(appt_start, appt_end) for appt_start, appt_end, _ in appt_ranges], dtype=np.int64)
+        overlaps = travel_overlap_mask(seg_bounds[:, 0], seg_bounds[:, 1], appt_bounds[:, 0], appt_bounds[:, 1])
+        
+        # Report conflicts in segment order, then appointment order
+        for seg_idx, appt_idx in zip(*np.nonzero(overlaps)):
+            seg_start, seg_end, seg_info = date_segments[seg_idx]
+            appt_time = appt_ranges[appt_idx][2]
+            travel_type = "from home" if seg_info.get('from_home') else ("to home" if seg_info['to_home'] else "between appointments")
+            conflicts.append(f"Travel {travel_type} ({seg_info['minutes']} min) overlaps with appointment at {appt_time}")
+            self.conflicting_segments.add((date_str, seg_start, seg_end))
         
         return conflicts
     
     def recalculate_travel_times(self, date_str):
-        """Recalculate travel times for a specific date"""
+        """Recalculate travel times for a specific date.
+        The result is reused when the date's appointments, durations and timetable bounds are unchanged."""
+        self.queued_recalc_dates.discard(date_str)
+        
         # Remove existing travel segments for this date
-        self.travel_segments = [seg for seg in self.travel_segments if seg[0] != date_str]
+        self.travel_segments.pop(date_str, None)
         
         # Remove existing conflicts for this date
         self.conflicting_segments = {seg for seg in self.conflicting_segments if seg[0] != date_str}
         
         # Get all appointments for this date, sorted by time
-        date_appointments = [(k, v) for k, v in self.appointments.items() if k[0] == date_str]
+        date_appointments = [((date_str, t), pc) for t, pc in self.appointments_by_date.get(date_str, {}).items()]
         if not date_appointments:
+            self.travel_cache.pop(date_str, None)
             return
         
         # Sort by time slot
-        date_appointments.sort(key=lambda x: self.time_slots.index(x[0][1]))
+        date_appointments.sort(key=lambda x: self.time_to_minutes(x[0][1]))
+        
+        # Reuse the previous result if nothing that feeds into it has changed
+        pending_duration = int(self.appointment_duration_var.get())
+        signature = (
+            tuple((cell_key[1], postcode, self.confirmed_appointments[postcode][2]
+                   if postcode in self.confirmed_appointments else pending_duration)
+                  for cell_key, postcode in date_appointments),
+            self.home_postcode, self.start_hour, self.end_hour
+        )
+        cached = self.travel_cache.get(date_str)
+        if cached is not None and cached[0] == signature:
+            _, self.travel_segments[date_str], boundary_conflicts = cached
+            self.conflicting_segments |= boundary_conflicts
+            return
+        
+        date_segments = self.travel_segments[date_str] = []
         
         # Calculate travel TO first appointment from home
         first_appt = date_appointments[0]
@@ -1258,7 +1472,7 @@ class SmartSchedulerApp:
             travel_start = first_time_minutes - travel_to_first
             # Always add, but mark as conflict if starts before timetable
             is_exceeding_start = travel_start < self.start_hour * 60
-            self.travel_segments.append((date_str, travel_start, first_time_minutes, {
+            date_segments.append((travel_start, first_time_minutes, {
                 'minutes': travel_to_first,
                 'to_home': False,
                 'from_home': True
@@ -1287,7 +1501,7 @@ class SmartSchedulerApp:
             # Travel starts after current appointment ends
             travel_end = current_end_minutes + travel_minutes
             
-            self.travel_segments.append((date_str, current_end_minutes, travel_end, {
+            date_segments.append((current_end_minutes, travel_end, {
                 'minutes': travel_minutes,
                 'to_home': False,
                 'from_home': False
@@ -1314,13 +1528,16 @@ class SmartSchedulerApp:
         
         # Always add travel home, but mark as conflict if it exceeds timetable end time
         is_exceeding_end = travel_home_end > self.end_hour * 60
-        self.travel_segments.append((date_str, last_end_minutes, travel_home_end, {
+        date_segments.append((last_end_minutes, travel_home_end, {
             'minutes': travel_home_minutes,
             'to_home': True,
             'from_home': False
         }))
         if is_exceeding_end:
             self.conflicting_segments.add((date_str, last_end_minutes, travel_home_end))
+        
+        boundary_conflicts = {seg for seg in self.conflicting_segments if seg[0] == date_str}
+        self.travel_cache[date_str] = (signature, date_segments, boundary_conflicts)
     
     def display_text_to_postcode(self, display_text):
         """Convert display text (name or postcode) to actual postcode for lookups"""
@@ -1329,23 +1546,12 @@ class SmartSchedulerApp:
         
         display_text = display_text.strip().upper()
         
-        # Check if it's already a postcode
-        postcode_match = self.clustered_regions_df[
-            self.clustered_regions_df['postcode'].str.upper() == display_text
-        ]
-        if not postcode_match.empty:
+        # Check if it's already a postcode (lookups built in build_location_details)
+        if display_text in self.known_postcodes_upper:
             return display_text
         
-        # Check if it's a client name
-        if 'client_name' in self.clustered_regions_df.columns:
-            name_match = self.clustered_regions_df[
-                self.clustered_regions_df['client_name'].str.upper() == display_text
-            ]
-            if not name_match.empty:
-                return name_match.iloc[0]['postcode'].strip().upper()
-        
-        # Return as-is if no match found
-        return display_text
+        # Check if it's a client name, otherwise return as-is
+        return self.client_name_postcodes.get(display_text, display_text)
     
     def get_travel_time(self, origin, destination):
         """Get travel time between two postcodes"""
@@ -1363,23 +1569,28 @@ class SmartSchedulerApp:
         if origin == destination:
             return 0  # No travel time if same location
         
-        try:
-            # Look up in distances dataframe (check both directions)
-            match = self.distances_df[
-                ((self.distances_df['origin'] == origin) & (self.distances_df['destination'] == destination)) |
-                ((self.distances_df['origin'] == destination) & (self.distances_df['destination'] == origin))
-            ]
-            
-            if not match.empty:
-                travel_time = match.iloc[0]['driving_time_minutes']
-                # Round up to nearest multiple of 30 for slot allocation
-                return max(int(travel_time), 1) if travel_time > 0 else 30
-            else:
-                print(f"Warning: No distance found for {origin} -> {destination}, using default 30 minutes")
-                return 30  # Default if not found
-        except Exception as e:
-            print(f"Error looking up travel time between {origin} and {destination}: {e}")
-            return 30
+        travel_time = self.travel_time_lookup.get((origin, destination))
+        if travel_time is None:
+            print(f"Warning: No distance found for {origin} -> {destination}, using default 30 minutes")
+            return 30  # Default if not found
+        return travel_time
+    
+    def build_travel_time_lookup(self):
+        """Build the (origin, destination) -> minutes lookup used by get_travel_time.
+        Both directions are stored; the first row for either direction of a pair wins."""
+        self.travel_time_lookup = {}
+        if self.distances_df is None:
+            return
+        
+        for origin, destination, travel_time in zip(self.distances_df['origin'],
+                                                     self.distances_df['destination'],
+                                                     self.distances_df['driving_time_minutes']):
+            origin = str(origin).strip().upper()
+            destination = str(destination).strip().upper()
+            # Round up to nearest multiple of 30 for slot allocation
+            minutes = max(int(travel_time), 1) if travel_time > 0 else 30
+            self.travel_time_lookup.setdefault((origin, destination), minutes)
+            self.travel_time_lookup.setdefault((destination, origin), minutes)
     
     def display_travel_times(self, postcode):
         """Display travel times from selected postcode to all other postcodes in region"""
@@ -1404,121 +1615,104 @@ class SmartSchedulerApp:
             self.suggestions_text.config(state='disabled')
             return
         
-        # Calculate travel times and sort by duration
-        travel_info = []
-        for other_pc in other_postcodes:
-            travel_time = self.get_travel_time(postcode, other_pc)
-            is_scheduled = other_pc in self.confirmed_appointments
-            travel_info.append((travel_time, other_pc, is_scheduled))
-        
-        # Sort by travel time (ascending)
-        travel_info.sort()
+        # Build the whole panel as (text, tag) chunks and hand it to the Text widget in one insert
+        table_header = f"{'Postcode':<12}{'Time (min)':<12}\n" + "-" * 40 + "\n"
         
-        # Display header for travel times to other postcodes
-        self.suggestions_text.insert(tk.END, f"Travel times from {postcode}:\n", 'header')
-        self.suggestions_text.insert(tk.END, f"{'Postcode':<12}{'Time (min)':<12}\n", 'normal')
-        self.suggestions_text.insert(tk.END, "-" * 40 + "\n", 'normal')
-        
-        # Display each postcode with travel time
-        for travel_time, other_pc, is_scheduled in travel_info:
-            line = f"{other_pc:<12}{travel_time:<12}\n"
-            
-            if is_scheduled:
-                # Highlight in red if already scheduled
-                self.suggestions_text.insert(tk.END, line, 'scheduled')
-            else:
-                self.suggestions_text.insert(tk.END, line, 'normal')
+        # Travel times to other postcodes
+        travel_times = np.fromiter((self.get_travel_time(postcode, pc) for pc in other_postcodes),
+                                   dtype=np.int64, count=len(other_postcodes))
+        chunks = [f"Travel times from {postcode}:\n", 'header', table_header, 'normal']
+        chunks += self.travel_time_rows(other_postcodes, travel_times)
         
         # Add section for travel times to home base
         if self.home_postcode:
-            self.suggestions_text.insert(tk.END, f"\nTravel times to {self.home_postcode} (Home):\n", 'header')
-            self.suggestions_text.insert(tk.END, f"{'Postcode':<12}{'Time (min)':<12}\n", 'normal')
-            self.suggestions_text.insert(tk.END, "-" * 40 + "\n", 'normal')
-            
-            # Calculate travel times to home for all postcodes
-            home_travel_info = []
-            for pc in self.region_postcodes:
-                travel_time = self.get_travel_time(pc, self.home_postcode)
-                is_scheduled = pc in self.confirmed_appointments
-                home_travel_info.append((travel_time, pc, is_scheduled))
-            
-            # Sort by travel time
-            home_travel_info.sort()
-            
-            # Display each postcode with travel time to home
-            for travel_time, pc, is_scheduled in home_travel_info:
-                line = f"{pc:<12}{travel_time:<12}\n"
-                
-                if is_scheduled:
-                    self.suggestions_text.insert(tk.END, line, 'scheduled')
-                else:
-                    self.suggestions_text.insert(tk.END, line, 'normal')
+            home_travel_times = np.fromiter((self.get_travel_time(pc, self.home_postcode) for pc in self.region_postcodes),
+                                            dtype=np.int64, count=len(self.region_postcodes))
+            chunks += [f"\nTravel times to {self.home_postcode} (Home):\n", 'header', table_header, 'normal']
+            chunks += self.travel_time_rows(self.region_postcodes, home_travel_times)
         
+        self.suggestions_text.insert(tk.END, *chunks)
         self.suggestions_text.config(state='disabled')
     
+    def travel_time_rows(self, postcodes, travel_times):
+        """Return flat [text, tag, ...] chunks for postcodes sorted by travel time (ascending).
+        Postcodes that are already scheduled are tagged for red highlighting.
+        Consecutive rows with the same tag are joined into a single chunk."""
+        chunks = []
+        run_lines = []
+        run_tag = None
+        # Stable sort keeps the (already sorted) postcode order for equal travel times
+        for i in np.argsort(travel_times, kind='stable'):
+            pc = postcodes[i]
+            tag = 'scheduled' if pc in self.confirmed_appointments else 'normal'
+            if tag != run_tag and run_lines:
+                chunks += [''.join(run_lines), run_tag]
+                run_lines = []
+            run_tag = tag
+            run_lines.append(f"{pc:<12}{int(travel_times[i]):<12}\n")
+        if run_lines:
+            chunks += [''.join(run_lines), run_tag]
+        return chunks
+    
     def clear_schedule(self):
         """Clear appointments for the currently selected region"""
-        if not self.selected_region:
-            self.show_info_dialog("No Region Selected", "Please select a region first.")
-            return
-        
-        # Get postcodes in the current region
-        region_postcodes_set = set(self.region_postcodes)
-        
-        # Check if there are any appointments in this region
-        region_appointments = {pc: data for pc, data in self.confirmed_appointments.items() if pc in region_postcodes_set}
-        region_pending = self.pending_appointment and self.pending_appointment[2] in region_postcodes_set
-        
-        if not region_appointments and not region_pending:
-            self.show_info_dialog("Empty Schedule", "No appointments in this region.")
-            return
-        
-        response = self.show_yes_no_dialog("Clear Region Schedule", 
-                                      f"Are you sure you want to clear all appointments for Region {self.selected_region}?")
-        if response:
-            # Clear appointments for postcodes in this region (appointments dict has (date, time) keys)
-            for cell_key in list(self.appointments.keys()):
-                if self.appointments[cell_key] in region_postcodes_set:
-                    del self.appointments[cell_key]
-            
-            # Clear confirmed appointments for postcodes in this region
-            for postcode in list(region_appointments.keys()):
-                del self.confirmed_appointments[postcode]
-            
-            # Clear pending if it's in this region
-            if region_pending:
-                self.pending_appointment = None
-                self.pending_label.config(text="")
-            
-            # Clear travel segments for dates in this region
-            region_dates = [d.strftime('%d-%b-%y') for d in self.selected_dates]
-            self.travel_segments = [seg for seg in self.travel_segments if seg[0] not in region_dates]
-            self.conflicting_segments.clear()
-            
-            # Update CSV - remove appointments for postcodes in this region
-            if self.appointments_csv and self.appointments_csv.exists():
-                df = pd.read_csv(self.appointments_csv)
-                df = df[~df['postcode'].isin(region_postcodes_set)]
-                df.to_csv(self.appointments_csv, index=False)
+        # Coalesce redraws into a single pass
+        with self.batch_updates():
+            if not self.selected_region:
+                self.show_info_dialog("No Region Selected", "Please select a region first.")
+                return
             
-            # Update display
-            self.update_timetable()
-            self.update_region_visualization()
+            # Get postcodes in the current region
+            region_postcodes_set = set(self.region_postcodes)
             
-            # Update travel times display
-            if self.postcode_var.get():
-                self.display_travel_times(self.postcode_var.get())
+            # Check if there are any appointments in this region
+            region_appointments = {pc: data for pc, data in self.confirmed_appointments.items() if pc in region_postcodes_set}
+            region_pending = self.pending_appointment and self.pending_appointment[2] in region_postcodes_set
             
-            self.status_label.config(text=f"Cleared schedule for Region {self.selected_region}", foreground='orange')
+            if not region_appointments and not region_pending:
+                self.show_info_dialog("Empty Schedule", "No appointments in this region.")
+                return
+            
+            response = self.show_yes_no_dialog("Clear Region Schedule", 
+                                          f"Are you sure you want to clear all appointments for Region {self.selected_region}?")
+            if response:
+                # Clear appointments for postcodes in this region (appointments dict has (date, time) keys)
+                for cell_key in list(self.appointments.keys()):
+                    if self.appointments[cell_key] in region_postcodes_set:
+                        self.remove_appointment(cell_key)
+                
+                # Clear confirmed appointments for postcodes in this region
+                for postcode in list(region_appointments.keys()):
+                    del self.confirmed_appointments[postcode]
+                
+                # Clear pending if it's in this region
+                if region_pending:
+                    self.pending_appointment = None
+                    self.pending_label.config(text="")
+                
+                # Clear travel segments for dates in this region
+                for d in self.selected_dates:
+                    self.travel_segments.pop(d.strftime('%d-%b-%y'), None)
+                self.conflicting_segments.clear()
+                
+                # Update CSV - remove appointments for postcodes in this region
+                self.schedule_appointments_flush()
+                
+                # Update display
+                self.queue_timetable_update()
+                self.queue_region_update()
+                
+                # Update travel times display
+                self.queue_travel_times_display()
+                
+                self.status_label.config(text=f"Cleared schedule for Region {self.selected_region}", foreground='orange')
     
     def on_postcode_selected(self, event=None):
-        """Handle postcode selection - update travel times display"""
+        """Handle postcode selection - update travel times display.
+        The travel times and map redraw is debounced so rapid selection changes only redraw once."""
         selected_index = self.postcode_combo.current()
         if selected_index >= 0 and selected_index < len(self.region_postcodes):
             postcode = self.region_postcodes[selected_index]
-            self.display_travel_times(postcode)
-            # Also update the map to highlight the selected postcode
-            self.update_region_visualization()
             
             # Enable/disable the offer slots button based on whether postcode has confirmed appointment
             if postcode in self.confirmed_appointments:
@@ -1527,33 +1721,57 @@ class SmartSchedulerApp:
                 self.offer_slots_btn.config(state='normal')
         else:
             self.offer_slots_btn.config(state='disabled')
+        
+        if self.postcode_refresh_id is not None:
+            self.root.after_cancel(self.postcode_refresh_id)
+        self.postcode_refresh_id = self.root.after(150, self.refresh_selected_postcode)
+    
+    def refresh_selected_postcode(self):
+        """Redraw travel times and the map for the currently selected postcode"""
+        self.postcode_refresh_id = None
+        selected_index = self.postcode_combo.current()
+        if selected_index >= 0 and selected_index < len(self.region_postcodes):
+            self.display_travel_times(self.region_postcodes[selected_index])
+            # Also update the map to highlight the selected postcode
+            self.update_region_visualization()
+    
+    def build_region_color_lookup(self):
+        """Build the postcode -> region and region -> color code dicts used by get_region_color_for_postcode"""
+        self.postcode_regions = {}
+        self.region_color_codes = {}
+        
+        if self.clustered_regions_df is not None:
+            for postcode, region in zip(self.clustered_regions_df['postcode'], self.clustered_regions_df['region']):
+                # The first row for a postcode wins
+                self.postcode_regions.setdefault(postcode, int(region))
+        
+        if self.region_names_df is not None and 'color_code' in self.region_names_df.columns:
+            for region, color_code in zip(self.region_names_df['region'], self.region_names_df['color_code']):
+                if pd.notna(color_code):
+                    self.region_color_codes.setdefault(int(region), int(color_code))
     
     def get_region_color_for_postcode(self, postcode):
         """Get the region color code for a given postcode"""
-        if self.clustered_regions_df is None:
-            return 1  # Default to Red
-        
         # Find which region this postcode belongs to
-        region_row = self.clustered_regions_df[self.clustered_regions_df['postcode'] == postcode]
-        if region_row.empty:
+        region_num = self.postcode_regions.get(postcode)
+        if region_num is None:
             return 1  # Default to Red
         
-        region_num = int(region_row.iloc[0]['region'])
-        
         # Get color from region_names_df
-        if self.region_names_df is not None:
-            region_data = self.region_names_df[self.region_names_df['region'] == region_num]
-            if not region_data.empty and 'color_code' in region_data.columns:
-                return int(region_data.iloc[0]['color_code'])
-        
-        return 1  # Default to Red
+        return self.region_color_codes.get(region_num, 1)
     
-    def create_or_update_category(self, outlook, category_name, color_index):
-        """Create or update an Outlook category with a specific color"""
+    def connect_to_outlook(self):
+        """Connect to Outlook, early-bound through the cached type library where available"""
+        try:
+            return win32com.client.gencache.EnsureDispatch("Outlook.Application")
+        except Exception:
+            # Type library cache can't be generated (e.g. read-only install) - use late binding
+            return win32com.client.Dispatch("Outlook.Application")
+    
+    def create_or_update_category(self, categories, category_name, color_index):
+        """Create or update an Outlook category with a specific color
+        categories: the MAPI namespace's Categories collection"""
         try:
-            namespace = outlook.GetNamespace("MAPI")
-            categories = namespace.Categories
-            
             # Try to get existing category
             try:
                 category = categories.Item(category_name)
@@ -1564,47 +1782,58 @@ class SmartSchedulerApp:
         except Exception as e:
             print(f"Error managing category '{category_name}': {e}")
     
-    def create_outlook_appointment(self, outlook, postcode, date_str, time_str, duration_minutes, category_name, color_index):
-        """Create an Outlook appointment for a confirmed appointment"""
+    def build_location_details(self):
+        """Build the client name / region lookups and per-region location lists used in Outlook appointments"""
+        self.location_details = {}
+        self.region_locations_text = {}
+        self.known_postcodes_upper = set()
+        self.client_name_postcodes = {}
+        df = self.clustered_regions_df
+        if df is None:
+            return
+        
+        if 'client_name' in df.columns:
+            names = df['client_name'].fillna('').astype(str).str.strip()
+        else:
+            names = [''] * len(df)
+        regions = [int(region) for region in df['region']] if 'region' in df.columns else [None] * len(df)
+        
+        # Build list of locations and names in each region
+        locations_by_region = {}
+        for pc, name, region in zip(df['postcode'].str.strip().str.upper(), names, regions):
+            # The first row for a postcode wins
+            self.location_details.setdefault(pc, (name or None, region))
+            if region is not None:
+                locations_by_region.setdefault(region, []).append(f"  • {pc}: {name}" if name else f"  • {pc}")
+        
+        for region, locations_list in locations_by_region.items():
+            self.region_locations_text[region] = f"\nLocations in Region {region}:\n" + "\n".join(sorted(locations_list))
+        
+        # Upper-cased lookups for display_text_to_postcode, so each call is a dict hit rather than a column scan
+        self.known_postcodes_upper = {pc.upper() for pc in df['postcode'] if isinstance(pc, str)}
+        if 'client_name' in df.columns:
+            for name, pc in zip(df['client_name'], df['postcode']):
+                if isinstance(name, str) and isinstance(pc, str):
+                    # The first row for a client name wins
+                    self.client_name_postcodes.setdefault(name.upper(), pc.strip().upper())
+    
+    def parse_appointment_starts(self, date_time_pairs):
+        """Parse [(date_str, time_str), ...] into start datetimes in one vectorised call (None where invalid)"""
+        starts = pd.to_datetime([f"{date_str} {time_str}" for date_str, time_str in date_time_pairs],
+                                format='%d-%b-%y %H:%M', errors='coerce')
+        return [None if pd.isna(start) else start.to_pydatetime() for start in starts]
+    
+    def create_outlook_appointment(self, outlook, postcode, date_str, time_str, start_datetime, duration_minutes, category_name):
+        """Create an Outlook appointment for a confirmed appointment
+        start_datetime comes from parse_appointment_starts; the category must already exist (see create_or_update_category)"""
         try:
-            # Ensure category exists with correct color
-            self.create_or_update_category(outlook, category_name, color_index)
-            
-            # Parse date and time
-            date_obj = datetime.strptime(date_str, "%d-%b-%y")
-            time_parts = time_str.split(':')
-            hours = int(time_parts[0])
-            minutes = int(time_parts[1])
-            
-            start_datetime = datetime(date_obj.year, date_obj.month, date_obj.day, hours, minutes)
+            if start_datetime is None:
+                raise ValueError(f"invalid date/time '{date_str} {time_str}'")
             end_datetime = start_datetime + timedelta(minutes=duration_minutes)
             
-            # Get client name from clustered_regions_df
-            client_name = None
-            if self.clustered_regions_df is not None:
-                postcode_upper = postcode.strip().upper()
-                location_data = self.clustered_regions_df[self.clustered_regions_df['postcode'].str.upper() == postcode_upper]
-                if len(location_data) > 0 and 'client_name' in location_data.columns:
-                    client_name = location_data.iloc[0]['client_name']
-            
-            # Get region and list of all locations in that region
-            region_locations = ""
-            if self.clustered_regions_df is not None:
-                postcode_upper = postcode.strip().upper()
-                location_data = self.clustered_regions_df[self.clustered_regions_df['postcode'].str.upper() == postcode_upper]
-                if len(location_data) > 0 and 'region' in location_data.columns:
-                    region_num = int(location_data.iloc[0]['region'])
-                    region_data = self.clustered_regions_df[self.clustered_regions_df['region'] == region_num]
-                    
-                    # Build list of locations and names in the region
-                    locations_list = []
-                    for _, row in region_data.iterrows():
-                        pc = row['postcode'].strip().upper()
-                        name = row.get('client_name', '') if 'client_name' in row else ''
-                        name = str(name).strip() if name else ''
-                        locations_list.append(f"  • {pc}: {name}" if name else f"  • {pc}")
-                    
-                    region_locations = f"\nLocations in Region {region_num}:\n" + "\n".join(sorted(locations_list))
+            # Get client name, region and list of all locations in that region (see build_location_details)
+            client_name, region_num = self.location_details.get(postcode.strip().upper(), (None, None))
+            region_locations = self.region_locations_text.get(region_num, "")
             
             # Create appointment (1 = olAppointmentItem)
             appointment = outlook.CreateItem(1)
@@ -1662,26 +1891,42 @@ class SmartSchedulerApp:
             return
         
         try:
-            # Connect to Outlook - try active object first, then dispatch
-            try:
-                outlook = win32com.client.GetActiveObject("Outlook.Application")
-            except:
-                outlook = win32com.client.Dispatch("Outlook.Application")
-                time.sleep(1)
+            # Connect to Outlook, then wait (up to 2s) for MAPI to respond if Outlook is still starting
+            outlook = self.connect_to_outlook()
+            namespace = None
+            for _ in range(20):
+                try:
+                    namespace = outlook.GetNamespace("MAPI")
+                    break
+                except Exception:
+                    time.sleep(0.1)
+            if namespace is None:
+                namespace = outlook.GetNamespace("MAPI")  # Still failing - let the error reach the dialog below
+            categories = namespace.Categories
+            
+            # Get the region category for each appointment, then make sure each distinct category exists once
+            sync_categories = {}
+            for postcode, _ in to_sync:
+                color_code = self.get_region_color_for_postcode(postcode)
+                sync_categories[postcode] = (OUTLOOK_CATEGORY_NAMES.get(color_code, DEFAULT_OUTLOOK_CATEGORY), color_code)
+            for category_name, color_code in set(sync_categories.values()):
+                self.create_or_update_category(categories, category_name, color_code)
+            
+            # Parse all start times together
+            start_datetimes = self.parse_appointment_starts([(data[0], data[1]) for _, data in to_sync])
             
             created_count = 0
             failed = []
+            synced = []
             
-            for postcode, (date, time_str, duration, in_outlook) in to_sync:
+            for (postcode, (date, time_str, duration, in_outlook)), start_datetime in zip(to_sync, start_datetimes):
                 try:
-                    # Get region color for this postcode
-                    color_code = self.get_region_color_for_postcode(postcode)
-                    color_name = OUTLOOK_COLORS.get(color_code, "Red")
-                    category_name = f"Appointment - {color_name}"
+                    category_name = sync_categories[postcode][0]
                     
                     # Create Outlook appointment
-                    if self.create_outlook_appointment(outlook, postcode, date, time_str, duration, category_name, color_code):
+                    if self.create_outlook_appointment(outlook, postcode, date, time_str, start_datetime, duration, category_name):
                         created_count += 1
+                        synced.append(postcode)
                         # Update in memory
                         self.confirmed_appointments[postcode] = (date, time_str, duration, True)
                     else:
@@ -1691,10 +1936,10 @@ class SmartSchedulerApp:
                     print(f"Error syncing {postcode}: {e}")
             
             # Update CSV with in_outlook flag
-            df = pd.read_csv(self.appointments_csv)
-            for postcode in [pc for pc, _ in to_sync if pc not in failed]:
-                df.loc[df['postcode'] == postcode, 'in_outlook'] = True
-            df.to_csv(self.appointments_csv, index=False)
+            if synced:
+                # Write the flags straight away - if they were lost, the next sync would create these events again
+                self.schedule_appointments_flush()
+                self.flush_appointments_csv()
             
             # Show results
             if created_count > 0:
@@ -1715,35 +1960,94 @@ class SmartSchedulerApp:
         """Load confirmed appointments from CSV"""
         if not self.appointments_csv.exists():
             # Create empty CSV with headers
-            df = pd.DataFrame(columns=['postcode', 'date', 'time', 'duration', 'in_outlook'])
-            df.to_csv(self.appointments_csv, index=False)
+            self.save_appointments_csv()
             return
         
-        df = pd.read_csv(self.appointments_csv)
+        df = pd.read_csv(self.appointments_csv, index_col='postcode', dtype=APPOINTMENTS_CSV_DTYPES, engine='c')
         self.confirmed_appointments = {}
         
-        for _, row in df.iterrows():
-            postcode = row['postcode']
-            date = row['date']
-            time = row['time']
-            # Default to 60 minutes if duration column doesn't exist (backward compatibility)
-            duration = int(row['duration']) if 'duration' in row and pd.notna(row['duration']) else 60
-            # Track if appointment is in Outlook (default to False for backward compatibility)
-            in_outlook = bool(row['in_outlook']) if 'in_outlook' in row and pd.notna(row['in_outlook']) else False
+        # Older files have fewer columns, so new rows can't simply be appended until the file is rewritten
+        if ['postcode'] + list(df.columns) != list(APPOINTMENTS_CSV_DTYPES):
+            self.appointments_csv_rewrite = True
+        
+        # Normalise the column types once instead of checking every row
+        # Default to 60 minutes if duration column doesn't exist (backward compatibility)
+        df['duration'] = df['duration'].fillna(60).astype(int) if 'duration' in df.columns else 60
+        # Track if appointment is in Outlook (default to False for backward compatibility)
+        df['in_outlook'] = df['in_outlook'].fillna(False).astype(bool) if 'in_outlook' in df.columns else False
+        
+        for postcode, date, time, duration, in_outlook in zip(df.index, df['date'], df['time'],
+                                                               df['duration'].tolist(), df['in_outlook'].tolist()):
             self.confirmed_appointments[postcode] = (date, time, duration, in_outlook)
         
-        # Also add to visual appointments dict and recalculate travel
+        # Also add to visual appointments dict and recalculate travel (once per date)
         for postcode, (date, time, duration, in_outlook) in self.confirmed_appointments.items():
-            self.appointments[(date, time)] = postcode
-            self.recalculate_travel_times(date)
+            self.add_appointment((date, time), postcode)
+        for date in {date for date, _, _, _ in self.confirmed_appointments.values()}:
+            self.queue_travel_recalc(date)
         
         # Update timetable display if we have selected dates
         if self.selected_dates:
-            self.update_timetable()
+            self.queue_timetable_update()
         
         # Update map visualization to show routes
         if self.selected_region is not None:
-            self.update_region_visualization()
+            self.queue_region_update()
+    
+    def schedule_appointments_flush(self, appended_postcode=None):
+        """Write the in-memory appointments to CSV shortly, coalescing rapid edits into one write.
+        appended_postcode: set when the change only added that appointment, so the write can append it"""
+        if appended_postcode is not None and not self.appointments_csv_rewrite:
+            self.appointments_csv_appends.append(appended_postcode)
+        else:
+            self.appointments_csv_rewrite = True
+            self.appointments_csv_appends = []
+        
+        if self.appointments_flush_id is not None:
+            self.root.after_cancel(self.appointments_flush_id)
+        self.appointments_flush_id = self.root.after(500, self.flush_appointments_csv)
+    
+    def flush_appointments_csv(self):
+        """Write pending appointment changes to CSV now (no-op if nothing is pending)"""
+        if self.appointments_flush_id is None:
+            return
+        self.root.after_cancel(self.appointments_flush_id)
+        self.appointments_flush_id = None
+        
+        rewrite = self.appointments_csv_rewrite
+        appended_postcodes = self.appointments_csv_appends
+        self.appointments_csv_rewrite = False
+        self.appointments_csv_appends = []
+        
+        try:
+            if rewrite:
+                self.save_appointments_csv()
+            else:
+                self.append_appointments_csv(appended_postcodes)
+        except Exception as e:
+            print(f"Error saving appointments: {e}")
+    
+    def save_appointments_csv(self):
+        """Write self.confirmed_appointments to the appointments CSV"""
+        if self.appointments_csv is None:
+            return
+        with open(self.appointments_csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(APPOINTMENTS_CSV_DTYPES))
+            writer.writerows((postcode, date, time, duration, in_outlook)
+                             for postcode, (date, time, duration, in_outlook) in self.confirmed_appointments.items())
+    
+    def append_appointments_csv(self, postcodes):
+        """Append the given confirmed appointments to the end of the appointments CSV"""
+        if self.appointments_csv is None:
+            return
+        write_header = not self.appointments_csv.exists() or self.appointments_csv.stat().st_size == 0
+        with open(self.appointments_csv, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(list(APPOINTMENTS_CSV_DTYPES))
+            writer.writerows((postcode, *self.confirmed_appointments[postcode])
+                             for postcode in postcodes if postcode in self.confirmed_appointments)
     
     def submit_appointment(self):
         """Submit the pending appointment after validation"""
@@ -1776,11 +2080,12 @@ class SmartSchedulerApp:
         outlook_success = False
         if add_to_outlook:
             try:
-                outlook = win32com.client.Dispatch("Outlook.Application")
+                outlook = self.connect_to_outlook()
                 color_code = self.get_region_color_for_postcode(actual_postcode)
-                color_name = OUTLOOK_COLORS.get(color_code, "Red")
-                category_name = f"Appointment - {color_name}"
-                outlook_success = self.create_outlook_appointment(outlook, postcode, date, time, duration, category_name, color_code)
+                category_name = OUTLOOK_CATEGORY_NAMES.get(color_code, DEFAULT_OUTLOOK_CATEGORY)
+                self.create_or_update_category(outlook.GetNamespace("MAPI").Categories, category_name, color_code)
+                start_datetime = self.parse_appointment_starts([(date, time)])[0]
+                outlook_success = self.create_outlook_appointment(outlook, postcode, date, time, start_datetime, duration, category_name)
             except Exception as e:
                 self.show_error_dialog("Outlook Error", f"Failed to create Outlook appointment:\\n{e}")
                 outlook_success = False
@@ -1788,27 +2093,20 @@ class SmartSchedulerApp:
         # Save to confirmed appointments (with outlook status) using actual postcode
         self.confirmed_appointments[actual_postcode] = (date, time, duration, outlook_success if add_to_outlook else False)
         
-        # Add to CSV using actual postcode
-        df = pd.read_csv(self.appointments_csv)
-        new_row = pd.DataFrame([{
-            'postcode': actual_postcode, 
-            'date': date, 
-            'time': time, 
-            'duration': duration,
-            'in_outlook': outlook_success if add_to_outlook else False
-        }])
-        df = pd.concat([df, new_row], ignore_index=True)
-        df.to_csv(self.appointments_csv, index=False)
+        # Add to CSV straight away - appending one row is cheap, and a confirmed booking shouldn't
+        # wait in memory where a crash could lose it
+        self.schedule_appointments_flush(appended_postcode=actual_postcode)
+        self.flush_appointments_csv()
         
         # Clear pending
         self.pending_appointment = None
         self.pending_label.config(text="")
         
-        # Update displays
-        self.update_timetable()
-        self.update_region_visualization()
-        if self.postcode_var.get():
-            self.display_travel_times(self.postcode_var.get())
+        # Update displays on idle, so the dialog closes and the status updates first
+        with self.batch_updates():
+            self.queue_timetable_update()
+            self.queue_region_update()
+            self.queue_travel_times_display()
         
         # Update status
         outlook_msg = " (added to Outlook)" if outlook_success else " (Outlook sync skipped)" if not add_to_outlook else " (Outlook failed)"
@@ -1818,20 +2116,45 @@ class SmartSchedulerApp:
     def show_submit_dialog(self, postcode, date, time, duration):
         """Show custom dialog for appointment submission with Outlook checkbox
         Returns: True if add to Outlook, False if don't add, None if cancelled"""
+        if self.submit_dialog is None or not self.submit_dialog.winfo_exists():
+            self.build_submit_dialog()
+        
+        dialog = self.submit_dialog
+        self.submit_detail_labels['location'].config(text=f"Location: {postcode}")
+        self.submit_detail_labels['date'].config(text=f"Date: {date}")
+        self.submit_detail_labels['time'].config(text=f"Time: {time}")
+        self.submit_detail_labels['duration'].config(text=f"Duration: {duration} minutes")
+        self.submit_outlook_var.set(True)  # Default to checked
+        self.submit_result = None
+        
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
         
+        # Wait for Confirm/Cancel, then hide the dialog for the next submission
+        self.submit_done_var.set(False)
+        dialog.wait_variable(self.submit_done_var)
+        if dialog.winfo_exists():
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        return self.submit_result
+    
+    def build_submit_dialog(self):
+        """Build the (hidden) appointment confirmation dialog used by show_submit_dialog"""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Confirm Appointment")
         dialog.geometry("450x300")
         dialog.transient(self.root)
-        dialog.grab_set()
         
         # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
+        x = (dialog.winfo_screenwidth() // 2) - (450 // 2)
+        y = (dialog.winfo_screenheight() // 2) - (300 // 2)
         dialog.geometry(f"+{x}+{y}")
         
-        result = [None]  # Use list to allow modification in nested function
+        self.submit_done_var = tk.BooleanVar(value=False)
+        self.submit_result = None
         
         # Main frame
         main_frame = ttk.Frame(dialog, padding="20")
@@ -1840,21 +2163,22 @@ class SmartSchedulerApp:
         # Title
         ttk.Label(main_frame, text="Confirm Appointment", font=('Arial', 14, 'bold')).pack(pady=(0, 15))
         
-        # Appointment details
+        # Appointment details (text set for each submission)
         details_frame = ttk.LabelFrame(main_frame, text="Appointment Details", padding="10")
         details_frame.pack(fill=tk.X, pady=(0, 15))
         
-        ttk.Label(details_frame, text=f"Location: {postcode}", font=('Arial', 10)).pack(anchor=tk.W, pady=2)
-        ttk.Label(details_frame, text=f"Date: {date}", font=('Arial', 10)).pack(anchor=tk.W, pady=2)
-        ttk.Label(details_frame, text=f"Time: {time}", font=('Arial', 10)).pack(anchor=tk.W, pady=2)
-        ttk.Label(details_frame, text=f"Duration: {duration} minutes", font=('Arial', 10)).pack(anchor=tk.W, pady=2)
+        self.submit_detail_labels = {}
+        for key in ('location', 'date', 'time', 'duration'):
+            label = ttk.Label(details_frame, font=('Arial', 10))
+            label.pack(anchor=tk.W, pady=2)
+            self.submit_detail_labels[key] = label
         
         # Outlook checkbox
-        outlook_var = tk.BooleanVar(value=True)  # Default to checked
+        self.submit_outlook_var = tk.BooleanVar(value=True)
         outlook_check = ttk.Checkbutton(
             main_frame, 
             text="Add appointment to Outlook Calendar",
-            variable=outlook_var
+            variable=self.submit_outlook_var
         )
         outlook_check.pack(pady=(0, 15))
         
@@ -1863,20 +2187,20 @@ class SmartSchedulerApp:
         button_frame.pack(fill=tk.X)
         
         def on_confirm():
-            result[0] = outlook_var.get()
-            dialog.destroy()
+            self.submit_result = self.submit_outlook_var.get()
+            self.submit_done_var.set(True)
         
         def on_cancel():
-            result[0] = None
-            dialog.destroy()
+            self.submit_result = None
+            self.submit_done_var.set(True)
         
         ttk.Button(button_frame, text="Confirm", command=on_confirm, width=15).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=on_cancel, width=15).pack(side=tk.LEFT, padx=5)
         
-        # Wait for dialog to close
-        dialog.wait_window()
+        # Closing the window counts as cancel
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
         
-        return result[0]
+        self.submit_dialog = dialog
 
     def get_available_slots(self):
         """Get all time slots without travel time conflicts for selected postcode, accounting for appointment duration"""
@@ -1902,27 +2226,25 @@ class SmartSchedulerApp:
                 
                 # Check if appointment would overlap with existing appointments on this date
                 has_conflict = False
-                for other_slot in self.time_slots:
+                for other_slot in self.appointments_by_date.get(date_str, {}):
                     other_start_minutes = self.time_to_minutes(other_slot)
                     other_cell_key = (date_str, other_slot)
                     
-                    # If there's an appointment in another slot, check if it overlaps
-                    if other_cell_key in self.appointments:
-                        # Get the duration of the other appointment (default to 30 min if not found)
-                        other_duration = 30
-                        if other_cell_key[1] in self.appointments:
-                            # Try to find duration from confirmed appointments
-                            for pc, (app_date, app_time, app_duration, _) in self.confirmed_appointments.items():
-                                if app_date == date_str and app_time == other_slot:
-                                    other_duration = app_duration
-                                    break
-                        
-                        other_end_minutes = other_start_minutes + other_duration
-                        
-                        # Check for overlap: new appointment and existing appointment
-                        if start_minutes < other_end_minutes and end_minutes > other_start_minutes:
-                            has_conflict = True
-                            break
+                    # Get the duration of the other appointment (default to 30 min if not found)
+                    other_duration = 30
+                    if other_cell_key[1] in self.appointments:
+                        # Try to find duration from confirmed appointments
+                        for pc, (app_date, app_time, app_duration, _) in self.confirmed_appointments.items():
+                            if app_date == date_str and app_time == other_slot:
+                                other_duration = app_duration
+                                break
+                    
+                    other_end_minutes = other_start_minutes + other_duration
+                    
+                    # Check for overlap: new appointment and existing appointment
+                    if start_minutes < other_end_minutes and end_minutes > other_start_minutes:
+                        has_conflict = True
+                        break
                 
                 if has_conflict:
                     continue
@@ -1933,13 +2255,13 @@ class SmartSchedulerApp:
                     continue
                 
                 # Temporarily add appointment to check for travel conflicts
-                self.appointments[cell_key] = postcode
+                self.add_appointment(cell_key, postcode)
                 self.recalculate_travel_times(date_str)
                 
                 conflicts = self.check_travel_conflicts(date_str)
                 
                 # Remove temporary appointment
-                del self.appointments[cell_key]
+                self.remove_appointment(cell_key)
                 
                 # If no conflicts, this slot is available
                 if not conflicts:
@@ -2179,9 +2501,18 @@ class SmartSchedulerApp:
         timetable_inner = ttk.Frame(canvas)
         canvas_window = canvas.create_window((0, 0), window=timetable_inner, anchor='nw')
         
-        def configure_scroll_region(event):
+        # The inner frame is resized once per added cell while the grid is built;
+        # measure it once after those layout passes have settled
+        scroll_region_id = [None]
+        
+        def finalize_scroll_region():
+            scroll_region_id[0] = None
             canvas.configure(scrollregion=canvas.bbox('all'))
         
+        def configure_scroll_region(event):
+            if scroll_region_id[0] is None:
+                scroll_region_id[0] = dialog.after_idle(finalize_scroll_region)
+        
         timetable_inner.bind('<Configure>', configure_scroll_region)
         
         # Message preview frame
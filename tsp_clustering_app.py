@@ -5,10 +5,16 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
-from sklearn.cluster import AgglomerativeClustering
-from scipy.spatial import ConvexHull
+from scipy.cluster.hierarchy import linkage
+from scipy.spatial import ConvexHull, cKDTree
+from scipy.spatial.distance import cdist, pdist, squareform
+from scipy.sparse.csgraph import minimum_spanning_tree
 from shapely.geometry import Polygon
+from shapely.prepared import prep
 import threading
+import csv
+import heapq
+from collections import deque
 import os
 import sys
 
@@ -66,6 +72,70 @@ OUTLOOK_COLORS = {
     24: "DarkPurple"
 }
 
+# Approximate RGB hex values of the Outlook category colors
+OUTLOOK_COLOR_HEX = {
+    1: '#DC143C',   # Red
+    2: '#FF8C00',   # Orange
+    3: '#FFB6C1',   # Peach
+    4: '#FFD700',   # Yellow
+    5: '#32CD32',   # Green
+    6: '#008B8B',   # Teal
+    7: '#808000',   # Olive
+    8: '#4169E1',   # Blue
+    9: '#9370DB',   # Purple
+    10: '#800000',  # Maroon
+    11: '#4682B4',  # Steel
+    12: '#36454F',  # DarkSteel
+    13: '#808080',  # Gray
+    14: '#696969',  # DarkGray
+    15: '#000000',  # Black
+    16: '#8B0000',  # DarkRed
+    17: '#FF4500',  # DarkOrange
+    18: '#CD5C5C',  # DarkPeach
+    19: '#DAA520',  # DarkYellow
+    20: '#006400',  # DarkGreen
+    21: '#008080',  # DarkTeal
+    22: '#556B2F',  # DarkOlive
+    23: '#00008B',  # DarkBlue
+    24: '#483D8B',  # DarkPurple
+}
+
+# Columns of distances.csv used for the driving time matrix (other columns are not read)
+DISTANCES_CSV_DTYPES = {
+    'origin': str,
+    'destination': str,
+    'driving_time_minutes': 'float32'
+}
+
+# Types of the clustered_regions.csv columns used to rebuild a clustering (other columns are inferred)
+CLUSTERED_REGIONS_CSV_DTYPES = {
+    'postcode': str,
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'region': 'int64'
+}
+
+# Columns of region_names.csv, in file order
+REGION_NAMES_CSV_COLUMNS = ['region', 'name', 'color_code']
+
+# Log messages kept for the log window; older ones are dropped
+MAX_LOG_LINES = 5000
+
+# Regions whose points span less than this in latitude or longitude are drawn without a hull
+HULL_MIN_SPAN_DEGREES = 1e-6
+
+# (lon, lat) offsets tried in order when a region label is crowded; row 0 keeps it at the centroid
+REGION_LABEL_OFFSETS = np.array([
+    (0, 0),
+    (0.01, 0.01), (-0.01, 0.01), (0.01, -0.01), (-0.01, -0.01),
+    (0.015, 0), (-0.015, 0), (0, 0.015), (0, -0.015),
+    (0.02, 0.01), (-0.02, -0.01), (0.01, 0.02), (-0.01, -0.02)
+])
+
+# Unit-circle octagon vertices, scaled and shifted to stand in for single-point regions in overlap checks
+_OCTAGON_ANGLES = np.linspace(0, 2*np.pi, 8, endpoint=False)
+OCTAGON_UNIT_OFFSETS = np.column_stack([np.cos(_OCTAGON_ANGLES), np.sin(_OCTAGON_ANGLES)])
+
 
 class TSPClusteringApp:
     def __init__(self, root, project_dir=None):
@@ -85,7 +155,15 @@ class TSPClusteringApp:
         self.depot_location = None
         self.canvas = None
         self.toolbar = None
+        self.cluster_figure = None  # Figure reused by create_visualization while its canvas is shown
+        self.hull_cache = {}  # {region index bytes: hull edges or None}, valid for hull_cache_coords
+        self.hull_cache_coords = None
+        self.region_names_saved = None  # (file source, rows) last written to region_names.csv by save_region_colors
+        self.region_names_csv_cache = None  # (source, columns, rows) last read by read_region_names_csv
         self.log_window = None
+        self.log_queue = deque()  # Messages waiting for drain_log_queue to write them to the log
+        self.log_drain_after_id = None  # Pending root.after call of drain_log_queue, cancelled on close
+        self.log_history = deque(maxlen=MAX_LOG_LINES)  # Most recent messages, shown when the log window opens
         
         # Store clustering results for saving
         self.clustered_results = None
@@ -101,6 +179,11 @@ class TSPClusteringApp:
         # Store available postcodes for depot selection
         self.available_postcodes = []
         
+        # distance_matrix.csv as last read by load_locations, with its upper-cased postcodes
+        self.locations_df = None
+        self.location_postcodes_upper = None
+        self.locations_source = None
+        
         # Store custom region names
         self.region_names = {}  # {region_number: custom_name}
         
@@ -116,6 +199,7 @@ class TSPClusteringApp:
                 print(f"Warning: Could not initialize display preferences: {e}")
         
         self.setup_ui()
+        self.drain_log_queue()
         
         # Auto-load project files if project directory provided
         if self.project_dir:
@@ -199,11 +283,6 @@ class TSPClusteringApp:
         self.status_label = ttk.Label(progress_frame, text="Ready", foreground="green", width=30)
         self.status_label.pack(side=tk.RIGHT, padx=5)
         
-        # Hidden log text (for internal use)
-        self.log_text = scrolledtext.ScrolledText(self.root, height=20, width=80, 
-                                                  font=('Consolas', 9))
-        # Not displayed in main window
-        
         # Try to set accent button style
         try:
             style = ttk.Style()
@@ -216,6 +295,10 @@ class TSPClusteringApp:
         
     def on_closing(self):
         """Handle window close event"""
+        # Stop the log polling, which would otherwise outlive this window inside the launcher's Tk process
+        if self.log_drain_after_id is not None:
+            self.root.after_cancel(self.log_drain_after_id)
+            self.log_drain_after_id = None
         if self.log_window:
             self.log_window.destroy()
         self.root.destroy()
@@ -391,28 +474,38 @@ class TSPClusteringApp:
         log_display.pack(fill=tk.BOTH, expand=True)
         
         # Copy existing log content
-        log_display.insert(tk.END, self.log_text.get("1.0", tk.END))
+        if self.log_history:
+            log_display.insert(tk.END, "\n".join(self.log_history) + "\n")
         log_display.config(state=tk.DISABLED)
         
         # Store reference to update it
         self.log_display_window = log_display
     
     def log(self, message):
-        """Add message to log"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-        
-        # Update log window if it's open
-        if self.log_window and tk.Toplevel.winfo_exists(self.log_window):
-            if hasattr(self, 'log_display_window'):
-                self.log_display_window.config(state=tk.NORMAL)
-                self.log_display_window.insert(tk.END, f"{message}\n")
-                self.log_display_window.see(tk.END)
-                self.log_display_window.config(state=tk.DISABLED)
-        
-        self.root.update_idletasks()
+        """Add message to log (safe to call from the clustering thread)"""
+        self.log_queue.append(message)
+    
+    def drain_log_queue(self):
+        """Write queued log messages with one insert per widget, then check again in 50ms"""
+        if self.log_queue:
+            messages = []
+            while self.log_queue:
+                messages.append(self.log_queue.popleft())
+            self.log_history.extend(messages)
+            
+            # Update log window if it's open
+            if self.log_window and tk.Toplevel.winfo_exists(self.log_window):
+                if hasattr(self, 'log_display_window'):
+                    self.log_display_window.config(state=tk.NORMAL)
+                    self.log_display_window.insert(tk.END, "\n".join(messages) + "\n")
+                    # Drop the oldest lines so the widget stays bounded like log_history
+                    excess_lines = int(self.log_display_window.index('end-1c').split('.')[0]) - MAX_LOG_LINES
+                    if excess_lines > 0:
+                        self.log_display_window.delete("1.0", f"{excess_lines + 1}.0")
+                    self.log_display_window.see(tk.END)
+                    self.log_display_window.config(state=tk.DISABLED)
+        
+        self.log_drain_after_id = self.root.after(50, self.drain_log_queue)
         
     def update_status(self, message, color="black"):
         """Update status label"""
@@ -444,11 +537,12 @@ class TSPClusteringApp:
             self.update_status("Loading previous results...", "blue")
             
             # Load clustered regions
-            results_df = pd.read_csv(clustered_file)
+            results_df = pd.read_csv(clustered_file, dtype=CLUSTERED_REGIONS_CSV_DTYPES, engine='c')
             self.log(f"✓ Loaded {len(results_df)} locations from clustered_regions.csv")
             
             # Extract depot (region 0) and customers
-            depot_row = results_df[results_df['region'] == 0]
+            depot_mask = (results_df['region'] == 0).to_numpy()
+            depot_row = results_df[depot_mask]
             if depot_row.empty:
                 # Fallback: use region -1 or first row
                 depot_row = results_df[results_df['region'] == -1]
@@ -465,14 +559,15 @@ class TSPClusteringApp:
             self.depot_postcode_var.set(depot_postcode)
             
             # Get customers (exclude depot, but include excluded locations with region -1)
-            customers_df = results_df[results_df['region'] != 0]
-            coords = customers_df[['latitude', 'longitude']].values
+            customers_df = results_df[~depot_mask]
+            # Row-major so each customer's (lat, lon) pair is contiguous for plotting and hulls
+            coords = np.ascontiguousarray(customers_df[['latitude', 'longitude']].to_numpy(dtype=np.float64))
             customer_postcodes = customers_df['postcode'].tolist()
             
             # Extract cluster labels (convert from 1-indexed to 0-indexed)
             # Region -1 stays as -1 (excluded), others convert from 1-indexed to 0-indexed
-            labels = customers_df['region'].values.copy()
-            labels = np.where(labels == -1, -1, labels - 1).astype(int)
+            labels = customers_df['region'].to_numpy(dtype=int, copy=True)
+            labels[labels != -1] -= 1
             
             # Calculate n_clusters (excluding -1 which is "excluded")
             active_regions = labels[labels >= 0]
@@ -491,27 +586,45 @@ class TSPClusteringApp:
             try:
                 distances_file = os.path.join(self.output_dir, "distances.csv")
                 if os.path.exists(distances_file):
-                    distances_df = pd.read_csv(distances_file)
+                    # Only the loaded locations are ever looked up, so other postcodes in
+                    # distances.csv don't get rows/columns in the matrix
+                    requested_postcodes = sorted(set(customer_postcodes) | {depot_postcode})
+                    distances_source = self.get_file_source(distances_file)
                     
-                    # Build postcode list
-                    all_postcodes = sorted(set(list(distances_df['origin'].unique()) + list(distances_df['destination'].unique())))
-                    postcode_to_idx = {pc: i for i, pc in enumerate(all_postcodes)}
-                    n = len(all_postcodes)
+                    # Reuse the matrix already in memory (e.g. Run followed by Load) if distances.csv
+                    # hasn't changed since it was built and it covers every loaded location
+                    in_memory = (getattr(self, 'driving_time_matrix', None) is not None
+                                 and getattr(self, 'driving_time_source', None) == distances_source
+                                 and set(requested_postcodes).issubset(self.driving_time_postcodes))
                     
-                    # Initialize matrix
-                    driving_time_matrix = np.full((n, n), np.inf)
-                    np.fill_diagonal(driving_time_matrix, 0)
+                    if in_memory:
+                        cached = (self.driving_time_postcodes, self.driving_time_matrix)
+                        self.log(f"✓ Reusing driving time matrix already in memory")
+                    else:
+                        cached = self.load_driving_time_cache(distances_file, requested_postcodes)
+                        if cached is not None:
+                            self.log(f"✓ Using cached driving time matrix")
                     
-                    # Fill in driving times
-                    for _, row in distances_df.iterrows():
-                        if row['origin'] in postcode_to_idx and row['destination'] in postcode_to_idx:
-                            i = postcode_to_idx[row['origin']]
-                            j = postcode_to_idx[row['destination']]
-                            driving_time_matrix[i, j] = row['driving_time_minutes']
-                            driving_time_matrix[j, i] = row['driving_time_minutes']
+                    if cached is not None:
+                        all_postcodes, driving_time_matrix = cached
+                    else:
+                        distances_df = pd.read_csv(distances_file, usecols=list(DISTANCES_CSV_DTYPES),
+                                                   dtype=DISTANCES_CSV_DTYPES, engine='c')
+                        
+                        # Build postcode list
+                        distance_postcodes = set(distances_df['origin'].unique()) | set(distances_df['destination'].unique())
+                        all_postcodes = [pc for pc in requested_postcodes if pc in distance_postcodes]
+                        
+                        # Build matrix
+                        driving_time_matrix = self.build_driving_time_matrix(distances_df, all_postcodes)
+                        self.save_driving_time_cache(distances_file, requested_postcodes, all_postcodes, driving_time_matrix)
+                    
+                    postcode_to_idx = {pc: i for i, pc in enumerate(all_postcodes)}
                     
                     # Store for minimum days calculation
                     self.driving_time_matrix = driving_time_matrix
+                    self.driving_time_postcodes = all_postcodes
+                    self.driving_time_source = distances_source
                     self.customer_postcode_to_idx = {pc: postcode_to_idx[pc] for pc in customer_postcodes if pc in postcode_to_idx}
                     self.depot_postcode_idx = postcode_to_idx[depot_postcode] if depot_postcode in postcode_to_idx else 0
                     
@@ -525,11 +638,13 @@ class TSPClusteringApp:
             self.depot = depot
             self.n_clusters = n_clusters
             self.customer_postcodes = customer_postcodes
+            self.customer_postcode_positions = {pc: i for i, pc in enumerate(customer_postcodes)}  # {postcode: index into labels}
             self.customer_names = customers_df['client_name'].tolist() if 'client_name' in customers_df.columns else [None] * len(customer_postcodes)
             self.depot_postcode = depot_postcode
             
             # Prepare results for potential saving
             self.clustered_results = results_df
+            self.clustered_results_rows = dict(zip(results_df['postcode'], results_df.index))  # {postcode: clustered_results row label}
             
             # Load summary if available
             summary_file = os.path.join(self.output_dir, "region_summary.csv")
@@ -538,25 +653,7 @@ class TSPClusteringApp:
                 self.log(f"✓ Loaded region_summary.csv")
             else:
                 # Recreate summary
-                summary = []
-                for i in range(n_clusters):
-                    region_postcodes = customers_df[customers_df['region'] == i+1]['postcode'].tolist()
-                    summary.append({
-                        'region': i+1,
-                        'customer_count': len(region_postcodes),
-                        'postcodes': ', '.join(region_postcodes)
-                    })
-                
-                # Add excluded locations if any
-                excluded_postcodes = customers_df[customers_df['region'] == -1]['postcode'].tolist()
-                if excluded_postcodes:
-                    summary.append({
-                        'region': 'Excluded',
-                        'customer_count': len(excluded_postcodes),
-                        'postcodes': ', '.join(excluded_postcodes)
-                    })
-                
-                self.summary_results = pd.DataFrame(summary)
+                self.summary_results = self.build_region_summary(customers_df, n_clusters)
                 self.log(f"✓ Recreated region summary")
             
             self.has_results = True
@@ -591,6 +688,89 @@ class TSPClusteringApp:
             self.update_status("Error loading results", "red")
             messagebox.showerror("Load Error", f"Error loading previous clustering:\n{e}")
     
+    def build_driving_time_matrix(self, distances_df, postcodes):
+        """Build the symmetric n x n driving time matrix (minutes, float32) from distances.csv rows.
+        Row/column k is postcodes[k]. Pairs missing from distances_df are np.inf, the diagonal is 0.
+        Rows whose postcodes aren't in postcodes are ignored; if a pair appears more than once the last row wins."""
+        n = len(postcodes)
+        # float32 halves the matrix size. Times are stored to 2 decimal places, so each is rounded by about 1e-7
+        # relative and per-cluster totals can differ from float64 in the last digits (e.g. 439.66736 vs 439.667393)
+        driving_time_matrix = np.full((n, n), np.inf, dtype=np.float32)
+        np.fill_diagonal(driving_time_matrix, 0)
+        
+        # Matrix index of each origin/destination, via pandas' hash table (-1 = not in postcodes)
+        postcode_index = pd.Index(postcodes)
+        i = postcode_index.get_indexer(distances_df['origin'])
+        j = postcode_index.get_indexer(distances_df['destination'])
+        times = distances_df['driving_time_minutes'].to_numpy(dtype=np.float32)
+        known = (i >= 0) & (j >= 0)
+        if not known.all():
+            i = i[known]
+            j = j[known]
+            times = times[known]
+        
+        # Write each pair once into the upper triangle, so a later row for either direction
+        # overrides an earlier one, the same as filling row by row. The flat index is built
+        # in place in one array rather than as separate row and column index arrays.
+        upper_flat = np.minimum(i, j)
+        upper_flat *= n
+        upper_flat += np.maximum(i, j)
+        driving_time_matrix.ravel()[upper_flat] = times
+        
+        # Mirror into the lower triangle - it is still all inf, so the minimum takes the upper value
+        np.minimum(driving_time_matrix, driving_time_matrix.T, out=driving_time_matrix)
+        return driving_time_matrix
+    
+    def get_file_source(self, file_path):
+        """Identify the current contents of file_path as (absolute path, mtime in ns, size)"""
+        source = os.stat(file_path)
+        return (os.path.abspath(file_path), source.st_mtime_ns, source.st_size)
+    
+    def load_driving_time_cache(self, distances_file, requested_postcodes):
+        """Return (postcodes, driving_time_matrix) saved by save_driving_time_cache, or None if there is
+        no cache or it is stale (distances.csv changed, or it was built for other locations)"""
+        cache_file = os.path.join(self.output_dir, "driving_time_cache.npz")
+        if not os.path.exists(cache_file):
+            return None
+        
+        try:
+            source = os.stat(distances_file)
+            with np.load(cache_file) as cache:
+                if (int(cache['source_mtime']) != source.st_mtime_ns or int(cache['source_size']) != source.st_size
+                        or cache['requested_postcodes'].tolist() != list(requested_postcodes)):
+                    return None
+                return cache['postcodes'].tolist(), cache['matrix']
+        except Exception as e:
+            self.log(f"⚠ Ignoring unreadable driving time cache: {e}")
+            return None
+    
+    def save_driving_time_cache(self, distances_file, requested_postcodes, postcodes, driving_time_matrix):
+        """Save the driving time matrix so the next load can skip parsing distances.csv"""
+        cache_file = os.path.join(self.output_dir, "driving_time_cache.npz")
+        try:
+            source = os.stat(distances_file)
+            np.savez_compressed(cache_file,
+                                matrix=driving_time_matrix,
+                                postcodes=np.array(postcodes, dtype=str),
+                                requested_postcodes=np.array(requested_postcodes, dtype=str),
+                                source_mtime=source.st_mtime_ns,
+                                source_size=source.st_size)
+        except Exception as e:
+            self.log(f"⚠ Could not save driving time cache: {e}")
+    
+    def load_locations(self):
+        """Return distance_matrix.csv as a DataFrame, re-reading it only when the file has changed.
+        Also refreshes available_postcodes (sorted) and location_postcodes_upper for depot lookups."""
+        distance_matrix_file = os.path.join(self.output_dir, "distance_matrix.csv")
+        source = self.get_file_source(distance_matrix_file)
+        if source != self.locations_source:
+            locations_df = pd.read_csv(distance_matrix_file)
+            self.location_postcodes_upper = locations_df['postcode'].str.upper().to_numpy()
+            self.available_postcodes = sorted(locations_df['postcode'].unique())
+            self.locations_df = locations_df
+            self.locations_source = source
+        return self.locations_df
+    
     def load_and_display_initial_visualization(self):
         """Load data and display initial visualization after configuration"""
         if not self.locations_file or not self.distances_file or not self.output_dir:
@@ -607,12 +787,9 @@ class TSPClusteringApp:
                 self.update_status("Missing distance_matrix.csv", "orange")
                 return
             
-            locations_df = pd.read_csv(distance_matrix_file)
+            locations_df = self.load_locations()
             self.log(f"✓ Loaded {len(locations_df)} locations with coordinates")
             
-            # Populate available postcodes (alphabetically sorted)
-            self.available_postcodes = sorted(locations_df['postcode'].unique())
-            
             # Update depot combobox if it exists
             if hasattr(self, 'depot_combo'):
                 self.depot_combo['values'] = self.available_postcodes
@@ -623,7 +800,7 @@ class TSPClusteringApp:
                 self.log(f"⚠ No home base postcode selected - using first location for visualization")
                 depot_row = locations_df.iloc[[0]]
             else:
-                depot_row = locations_df[locations_df['postcode'].str.upper() == depot_postcode]
+                depot_row = locations_df[self.location_postcodes_upper == depot_postcode]
                 
                 if depot_row.empty:
                     self.log(f"⚠ Home base postcode '{depot_postcode}' not found, using first location")
@@ -711,6 +888,12 @@ class TSPClusteringApp:
             # Always recalculate minimum_days (don't skip if column exists)
             minimum_days_list = []
             
+            # Group every region's customers in one pass rather than one labels scan per region
+            if hasattr(self, 'driving_time_matrix') and hasattr(self, 'customer_postcode_to_idx'):
+                region_matrix_indices = self.get_region_matrix_indices()
+            else:
+                region_matrix_indices = {}
+            
             for _, row in self.summary_results.iterrows():
                 region_num = row['region']
                 
@@ -722,7 +905,7 @@ class TSPClusteringApp:
                 # Ensure region_num is an integer
                 region_num = int(region_num)
                 
-                min_days = self.calculate_minimum_days_for_region(region_num)
+                min_days = self.calculate_minimum_days_for_region(region_num, region_matrix_indices.get(region_num))
                 minimum_days_list.append(min_days)
                 
                 region_name = self.get_region_display_name(region_num)
@@ -806,12 +989,13 @@ class TSPClusteringApp:
             self.progress_bar['value'] = 10
             
             # Load coordinates from distance_matrix.csv
-            distance_matrix_file = os.path.join(self.output_dir, "distance_matrix.csv")
-            locations_df = pd.read_csv(distance_matrix_file)
+            locations_df = self.load_locations()
             self.log(f"✓ Loaded {len(locations_df)} locations with coordinates")
             
             # Load distances
-            distances_df = pd.read_csv(self.distances_file)
+            distances_source = self.get_file_source(self.distances_file)
+            distances_df = pd.read_csv(self.distances_file, usecols=list(DISTANCES_CSV_DTYPES),
+                                       dtype=DISTANCES_CSV_DTYPES, engine='c')
             self.log(f"✓ Loaded {len(distances_df)} distance records")
             
             self.progress_bar['value'] = 20
@@ -822,23 +1006,15 @@ class TSPClusteringApp:
             n = len(postcodes)
             postcode_to_idx = {pc: i for i, pc in enumerate(postcodes)}
             
-            # Initialize with infinity
-            driving_time_matrix = np.full((n, n), np.inf)
-            np.fill_diagonal(driving_time_matrix, 0)
-            
-            # Fill in known driving times
-            for _, row in distances_df.iterrows():
-                if row['origin'] in postcode_to_idx and row['destination'] in postcode_to_idx:
-                    i = postcode_to_idx[row['origin']]
-                    j = postcode_to_idx[row['destination']]
-                    driving_time_matrix[i, j] = row['driving_time_minutes']
-                    driving_time_matrix[j, i] = row['driving_time_minutes']  # Symmetric
+            # Fill in known driving times (unknown pairs stay at infinity)
+            driving_time_matrix = self.build_driving_time_matrix(distances_df, postcodes)
             
             self.log(f"✓ Built {n}x{n} driving time matrix")
             self.progress_bar['value'] = 30
             
-            # Find depot postcode in locations
-            depot_row = locations_df[locations_df['postcode'].str.upper() == depot_postcode]
+            # Find depot postcode in locations (the mask serves the depot and customer split)
+            depot_mask = self.location_postcodes_upper == depot_postcode
+            depot_row = locations_df[depot_mask]
             
             if depot_row.empty:
                 error_msg = f"Home base postcode '{depot_postcode}' not found in locations CSV!"
@@ -854,7 +1030,7 @@ class TSPClusteringApp:
             self.log(f"✓ Home base location: {depot_postcode} at ({depot_lat:.4f}, {depot_lon:.4f})")
             
             # Extract customer coordinates (excluding depot)
-            customers_df = locations_df[locations_df['postcode'].str.upper() != depot_postcode]
+            customers_df = locations_df[~depot_mask]
             coords = customers_df[['latitude', 'longitude']].values
             self.log(f"✓ Clustering {len(coords)} customers (depot excluded)")
             
@@ -896,7 +1072,7 @@ class TSPClusteringApp:
             
             # Add cluster assignments to customer locations (depot separate)
             results_df = customers_df.copy()
-            results_df['region'] = [labels[customer_postcode_to_idx[pc]] + 1 for pc in results_df['postcode']]
+            results_df['region'] = labels[results_df['postcode'].map(customer_postcode_to_idx).to_numpy(dtype=np.intp)] + 1
             results_df = results_df.sort_values('region')
             
             # Add depot as a separate entry with region 0
@@ -905,19 +1081,11 @@ class TSPClusteringApp:
             results_df = pd.concat([depot_row_copy, results_df], ignore_index=True)
             
             # Create summary
-            summary = []
-            for i in range(actual_regions):
-                region_postcodes = results_df[results_df['region'] == i+1]['postcode'].tolist()
-                summary.append({
-                    'region': i+1,
-                    'customer_count': len(region_postcodes),
-                    'postcodes': ', '.join(region_postcodes)
-                })
-            
-            summary_df = pd.DataFrame(summary)
+            summary_df = self.build_region_summary(results_df, actual_regions)
             
             # Store results for manual saving
             self.clustered_results = results_df
+            self.clustered_results_rows = dict(zip(results_df['postcode'], results_df.index))  # {postcode: clustered_results row label}
             self.summary_results = summary_df
             self.has_results = True
             
@@ -927,9 +1095,12 @@ class TSPClusteringApp:
             self.depot = depot
             self.n_clusters = actual_regions
             self.customer_postcodes = customer_postcodes
+            self.customer_postcode_positions = {pc: i for i, pc in enumerate(customer_postcodes)}  # {postcode: index into labels}
             self.customer_names = customers_df['client_name'].tolist() if 'client_name' in customers_df.columns else [None] * len(customer_postcodes)
             self.depot_postcode = depot_postcode
             self.driving_time_matrix = driving_time_matrix
+            self.driving_time_postcodes = postcodes
+            self.driving_time_source = distances_source
             self.customer_postcode_to_idx = customer_postcode_to_idx
             self.depot_postcode_idx = postcode_to_idx[depot_postcode]
             
@@ -983,10 +1154,7 @@ class TSPClusteringApp:
                 if len(cluster_points) == 1:
                     point = cluster_points[0]
                     radius = 1.0
-                    circle_points = np.array([
-                        [point[0] + radius * np.cos(theta), point[1] + radius * np.sin(theta)]
-                        for theta in np.linspace(0, 2*np.pi, 8, endpoint=False)
-                    ])
+                    circle_points = point + radius * OCTAGON_UNIT_OFFSETS
                     polygons.append(Polygon(circle_points))
                 elif len(cluster_points) == 2:
                     # Create a thin rectangle around the two points
@@ -1005,10 +1173,17 @@ class TSPClusteringApp:
                     # If convex hull fails, use all points
                     polygons.append(Polygon(cluster_points))
         
-        # Check all pairs for overlaps
+        # Check all pairs for overlaps - only pairs whose bounding boxes overlap can intersect
+        bounds = np.array([polygon.bounds for polygon in polygons], dtype=float).reshape(-1, 4)  # minx, miny, maxx, maxy
         for i in range(len(polygons)):
-            for j in range(i + 1, len(polygons)):
-                if polygons[i].intersects(polygons[j]) and not polygons[i].touches(polygons[j]):
+            later = bounds[i + 1:]
+            candidates = i + 1 + np.flatnonzero((later[:, 0] <= bounds[i, 2]) & (later[:, 2] >= bounds[i, 0]) &
+                                                (later[:, 1] <= bounds[i, 3]) & (later[:, 3] >= bounds[i, 1]))
+            if len(candidates) == 0:
+                continue
+            prepared_i = prep(polygons[i])  # Indexes polygon i's edges once for all its candidates
+            for j in candidates:
+                if prepared_i.intersects(polygons[j]) and not polygons[i].touches(polygons[j]):
                     return True
         
         return False
@@ -1023,11 +1198,7 @@ class TSPClusteringApp:
         self.log(f"  Minimum cluster size: {min_size} (hard-coded)")
         
         # Calculate proximity threshold - customers closer than this MUST be in same cluster
-        all_distances = []
-        for i in range(len(coords)):
-            for j in range(i+1, len(coords)):
-                dist = np.linalg.norm(coords[i] - coords[j])
-                all_distances.append(dist)
+        all_distances = pdist(coords)  # Condensed pairwise distances, pair (i, j) for i < j in row order
         
         proximity_threshold = np.percentile(all_distances, 10)  # Bottom 10% of distances
         self.log(f"  Proximity threshold: {proximity_threshold:.4f} (keeping nearest neighbors together)")
@@ -1035,47 +1206,57 @@ class TSPClusteringApp:
         # Use hierarchical clustering with Ward linkage (minimizes variance = compactness)
         # This creates the most spatially efficient clusters regardless of depot location
         self.log("  Running hierarchical clustering...")
-        clustering = AgglomerativeClustering(
-            n_clusters=n_clusters, 
-            linkage='ward',  # Minimizes within-cluster variance
-            metric='euclidean'
-        )
-        labels = clustering.fit_predict(coords)
+        merge_tree = linkage(all_distances, method='ward')  # Reuses the pairwise distances from above
+        labels = self.cut_merge_tree(merge_tree, n_clusters)
         
         # Enforce proximity constraint: nearby points must be in same cluster
         self.log("  Enforcing proximity constraints...")
         max_proximity_iterations = 100
+        
+        # Pairs (i < j, in row order) closer than the threshold - only these can ever violate it
+        close_i, close_j = np.nonzero(np.triu(squareform(all_distances < proximity_threshold), k=1))
+        close_pairs = list(zip(close_i.tolist(), close_j.tolist()))
+        
+        # The pass is scalar work per pair, so run it on plain Python ints (indexing numpy arrays
+        # element by element boxes every value) and copy the labels back afterwards
+        label_list = labels.tolist()
+        cluster_sizes = np.bincount(labels, minlength=n_clusters).tolist()  # Kept in step with label_list
+        
         for prox_iter in range(max_proximity_iterations):
             violations_fixed = 0
             
-            for i in range(len(coords)):
-                for j in range(i+1, len(coords)):
-                    if labels[i] != labels[j]:
-                        dist = np.linalg.norm(coords[i] - coords[j])
-                        
-                        if dist < proximity_threshold:
-                            # These points are too close but in different clusters - merge them
-                            cluster_i_size = np.sum(labels == labels[i])
-                            cluster_j_size = np.sum(labels == labels[j])
-                            
-                            # Move from larger cluster to smaller (or merge smaller into larger)
-                            if cluster_i_size > cluster_j_size and cluster_i_size > min_size:
-                                labels[i] = labels[j]
-                                violations_fixed += 1
-                            elif cluster_j_size >= min_size:
-                                labels[j] = labels[i]
-                                violations_fixed += 1
+            for i, j in close_pairs:
+                label_i = label_list[i]
+                label_j = label_list[j]
+                if label_i != label_j:
+                    # These points are too close but in different clusters - merge them
+                    cluster_i_size = cluster_sizes[label_i]
+                    cluster_j_size = cluster_sizes[label_j]
+                    
+                    # Move from larger cluster to smaller (or merge smaller into larger)
+                    if cluster_i_size > cluster_j_size and cluster_i_size > min_size:
+                        cluster_sizes[label_i] -= 1
+                        cluster_sizes[label_j] += 1
+                        label_list[i] = label_j
+                        violations_fixed += 1
+                    elif cluster_j_size >= min_size:
+                        cluster_sizes[label_j] -= 1
+                        cluster_sizes[label_i] += 1
+                        label_list[j] = label_i
+                        violations_fixed += 1
             
             if violations_fixed == 0:
                 break
         
+        labels[:] = label_list
+        
         self.log(f"  ✓ Proximity constraints enforced after {prox_iter + 1} iterations")
         
         # Ensure minimum cluster sizes
         self.log("  Ensuring minimum cluster sizes...")
+        cluster_sizes = np.bincount(labels, minlength=n_clusters)  # Kept in step with labels below
         for cluster_id in range(n_clusters):
-            while np.sum(labels == cluster_id) < min_size:
-                cluster_sizes = [np.sum(labels == i) for i in range(n_clusters)]
+            while cluster_sizes[cluster_id] < min_size:
                 largest_cluster = np.argmax(cluster_sizes)
                 
                 if cluster_sizes[largest_cluster] <= min_size:
@@ -1085,21 +1266,28 @@ class TSPClusteringApp:
                 largest_mask = labels == largest_cluster
                 cluster_mask = labels == cluster_id
                 
-                if np.sum(cluster_mask) > 0:
+                if cluster_sizes[cluster_id] > 0:
                     cluster_points = coords[cluster_mask]
                     cluster_centroid = cluster_points.mean(axis=0)
                 else:
                     cluster_centroid = coords[np.random.choice(np.where(largest_mask)[0])]
                 
                 largest_indices = np.where(largest_mask)[0]
-                distances_to_cluster = [np.linalg.norm(coords[idx] - cluster_centroid) for idx in largest_indices]
+                distances_to_cluster = np.linalg.norm(coords[largest_indices] - cluster_centroid, axis=1)
                 closest_idx = largest_indices[np.argmin(distances_to_cluster)]
                 
                 labels[closest_idx] = cluster_id
+                cluster_sizes[largest_cluster] -= 1
+                cluster_sizes[cluster_id] += 1
         
         # Check for and fix overlaps while maintaining spatial compactness
         self.log("  Checking for region overlaps...")
         max_overlap_iterations = 100
+        
+        # {cluster_id: (member indices, hull polygon or None)} - a cluster's entry is dropped when
+        # a point moves in or out, so each hull is only rebuilt after its cluster changes
+        cluster_hulls = {}
+        
         for overlap_iter in range(max_overlap_iterations):
             if overlap_iter % 25 == 0 and overlap_iter > 0:
                 self.log(f"    Overlap check iteration {overlap_iter}/100...")
@@ -1108,42 +1296,41 @@ class TSPClusteringApp:
                 break
             
             # Find overlapping regions and move boundary points
+            cluster_sizes = np.bincount(labels, minlength=n_clusters)  # Kept in step with labels below
             for i in range(n_clusters):
                 for j in range(i + 1, n_clusters):
-                    mask_i = labels == i
-                    mask_j = labels == j
-                    
-                    if np.sum(mask_i) <= min_size or np.sum(mask_j) <= min_size:
+                    if cluster_sizes[i] <= min_size or cluster_sizes[j] <= min_size:
                         continue
                     
-                    points_i = coords[mask_i]
-                    points_j = coords[mask_j]
+                    for cluster_id in (i, j):
+                        if cluster_id not in cluster_hulls:
+                            member_indices = np.where(labels == cluster_id)[0]
+                            try:
+                                hull = ConvexHull(coords[member_indices])
+                                cluster_hulls[cluster_id] = (member_indices[hull.vertices], Polygon(coords[member_indices[hull.vertices]]))
+                            except Exception:
+                                cluster_hulls[cluster_id] = (member_indices, None)
+                    
+                    hull_indices_i, poly_i = cluster_hulls[i]
+                    poly_j = cluster_hulls[j][1]
+                    if poly_i is None or poly_j is None:
+                        continue
                     
-                    if len(points_i) >= 3 and len(points_j) >= 3:
-                        try:
-                            hull_i = ConvexHull(points_i)
-                            hull_j = ConvexHull(points_j)
-                            poly_i = Polygon(points_i[hull_i.vertices])
-                            poly_j = Polygon(points_j[hull_j.vertices])
+                    try:
+                        if poly_i.intersects(poly_j) and not poly_i.touches(poly_j):
+                            # Find hull point of cluster i (a boundary point) closest to cluster j
+                            centroid_j = coords[labels == j].mean(axis=0)
+                            distances = np.linalg.norm(coords[hull_indices_i] - centroid_j, axis=1)
+                            closest_hull_idx = hull_indices_i[np.argmin(distances)]
                             
-                            if poly_i.intersects(poly_j) and not poly_i.touches(poly_j):
-                                # Find boundary point in cluster i furthest from its centroid
-                                centroid_i = points_i.mean(axis=0)
-                                indices_i = np.where(mask_i)[0]
-                                
-                                # Get points on convex hull (boundary points)
-                                hull_indices_i = indices_i[hull_i.vertices]
-                                
-                                # Find hull point closest to cluster j
-                                centroid_j = points_j.mean(axis=0)
-                                distances = [np.linalg.norm(coords[idx] - centroid_j) for idx in hull_indices_i]
-                                closest_hull_idx = hull_indices_i[np.argmin(distances)]
-                                
-                                # Move it to cluster j
-                                labels[closest_hull_idx] = j
-                                break
-                        except:
-                            pass
+                            # Move it to cluster j
+                            labels[closest_hull_idx] = j
+                            cluster_sizes[i] -= 1
+                            cluster_sizes[j] += 1
+                            del cluster_hulls[i], cluster_hulls[j]
+                            break
+                    except Exception:
+                        pass
         
         if overlap_iter < max_overlap_iterations - 1:
             self.log(f"  ✓ Overlaps resolved after {overlap_iter + 1} iterations")
@@ -1156,46 +1343,47 @@ class TSPClusteringApp:
         for compact_iter in range(max_compactness_iterations):
             improved = False
             
+            # Coordinate sums and sizes per cluster, refreshed for the two clusters involved
+            # whenever an outlier moves, so every centroid is sums / sizes
+            cluster_sums = np.column_stack([np.bincount(labels, weights=coords[:, 0], minlength=n_clusters),
+                                            np.bincount(labels, weights=coords[:, 1], minlength=n_clusters)])
+            cluster_sizes = np.bincount(labels, minlength=n_clusters)
+            
             for cluster_id in range(n_clusters):
                 mask = labels == cluster_id
-                cluster_size = np.sum(mask)
+                cluster_size = cluster_sizes[cluster_id]
                 
                 if cluster_size <= min_size:
                     continue
                 
-                cluster_points = coords[mask]
-                centroid = cluster_points.mean(axis=0)
+                centroid = cluster_sums[cluster_id] / cluster_size
                 indices = np.where(mask)[0]
                 
                 # Find outlier points (furthest from centroid)
-                distances = [np.linalg.norm(coords[idx] - centroid) for idx in indices]
+                distances = np.linalg.norm(coords[indices] - centroid, axis=1)
                 if len(distances) == 0:
                     continue
                     
                 # Check if outlier would fit better in another cluster
-                outlier_idx = indices[np.argmax(distances)]
-                outlier_dist_from_own = max(distances)
-                
-                # Find nearest other cluster
-                best_cluster = None
-                min_dist_to_other = float('inf')
+                outlier_local = distances.argmax()
+                outlier_idx = indices[outlier_local]
+                outlier_dist_from_own = distances[outlier_local]
                 
-                for other_id in range(n_clusters):
-                    if other_id == cluster_id:
-                        continue
-                    other_mask = labels == other_id
-                    other_points = coords[other_mask]
-                    if len(other_points) > 0:
-                        other_centroid = other_points.mean(axis=0)
-                        dist = np.linalg.norm(coords[outlier_idx] - other_centroid)
-                        
-                        # Move outlier if it's significantly closer to another cluster
-                        if dist < min_dist_to_other and dist < outlier_dist_from_own * 0.8:
-                            min_dist_to_other = dist
-                            best_cluster = other_id
+                # Find nearest other cluster (empty clusters have no centroid)
+                occupied = cluster_sizes > 0
+                dist_to_centroids = np.full(n_clusters, np.inf)
+                dist_to_centroids[occupied] = np.linalg.norm(
+                    cluster_sums[occupied] / cluster_sizes[occupied, None] - coords[outlier_idx], axis=1)
+                dist_to_centroids[cluster_id] = np.inf
+                best_cluster = int(np.argmin(dist_to_centroids))
                 
-                if best_cluster is not None:
+                # Move outlier if it's significantly closer to another cluster
+                if dist_to_centroids[best_cluster] < outlier_dist_from_own * 0.8:
                     labels[outlier_idx] = best_cluster
+                    for changed_id in (cluster_id, best_cluster):
+                        cluster_sums[changed_id] = coords[labels == changed_id].sum(axis=0)
+                    cluster_sizes[cluster_id] -= 1
+                    cluster_sizes[best_cluster] += 1
                     improved = True
             
             if not improved:
@@ -1216,24 +1404,59 @@ class TSPClusteringApp:
                 metrics.append(0)
                 continue
             
-            # Calculate sum of all pairwise distances within cluster
-            cluster_distance_sum = 0
-            for i in cluster_indices:
-                for j in cluster_indices:
-                    if i < j:
-                        cluster_distance_sum += driving_time_matrix[i, j]
+            # Calculate sum of all pairwise distances within cluster (pairs without a driving time are skipped)
+            cluster_times = driving_time_matrix[np.ix_(cluster_indices, cluster_indices)]
+            pair_times = cluster_times[np.triu_indices(len(cluster_indices), k=1)]
+            cluster_distance_sum = float(pair_times[np.isfinite(pair_times)].sum(dtype=np.float64))
             
             metrics.append(cluster_distance_sum)
             total_intra_distance += cluster_distance_sum
         
         self.log(f"  Total intra-cluster distance: {total_intra_distance:.2f}")
-        self.log(f"  Cluster sizes: {[np.sum(labels == i) for i in range(n_clusters)]}")
+        self.log(f"  Cluster sizes: {np.bincount(labels, minlength=n_clusters).tolist()}")
         
         return labels, metrics
     
-    def calculate_minimum_days_for_region(self, region_num):
+    def cut_merge_tree(self, merge_tree, n_clusters):
+        """Cut a scipy linkage matrix into n_clusters flat clusters by undoing its last merges.
+        Clusters are numbered in the order sklearn's AgglomerativeClustering used, so the
+        proximity/overlap passes that follow see the same numbering"""
+        n_leaves = len(merge_tree) + 1
+        
+        # Max-heap (negated ids) of the subtrees that become clusters - node k >= n_leaves was formed
+        # by merge_tree row k - n_leaves, so the largest id is always the most recent merge
+        top_nodes = [-(2 * n_leaves - 2)]
+        for _ in range(n_clusters - 1):
+            left, right = merge_tree[-top_nodes[0] - n_leaves, :2].astype(int)
+            heapq.heappush(top_nodes, -left)
+            heapq.heappushpop(top_nodes, -right)  # Pops the merged node, which has the largest id
+        
+        labels = np.zeros(n_leaves, dtype=int)
+        for cluster_id, node in enumerate(top_nodes):
+            stack = [-node]
+            while stack:
+                k = stack.pop()
+                if k < n_leaves:
+                    labels[k] = cluster_id
+                else:
+                    stack.extend(merge_tree[k - n_leaves, :2].astype(int))
+        return labels
+    
+    def get_region_matrix_indices(self):
+        """Driving matrix indices of each region's customers as {region_num: array}, from one pass
+        over the labels. Customers without driving times are left out, excluded locations are skipped"""
+        customer_matrix_indices = np.array([self.customer_postcode_to_idx.get(pc, -1) for pc in self.customer_postcodes],
+                                           dtype=np.intp)
+        order = np.argsort(self.labels, kind='stable')  # Groups customers by label, keeping their order
+        region_labels, starts = np.unique(self.labels[order], return_index=True)
+        region_members = np.split(customer_matrix_indices[order], starts[1:])
+        return {int(label) + 1: members[members >= 0]
+                for label, members in zip(region_labels, region_members) if label >= 0}
+    
+    def calculate_minimum_days_for_region(self, region_num, matrix_indices=None):
         """Calculate minimum days needed to service all customers in a region
-        Returns technical minimum + 1 day buffer"""
+        Returns technical minimum + 1 day buffer
+        matrix_indices can be passed from get_region_matrix_indices when doing every region"""
         if not hasattr(self, 'driving_time_matrix') or not hasattr(self, 'customer_postcode_to_idx'):
             # Return fallback - 1 day per 5 customers as rough estimate
             if hasattr(self, 'labels'):
@@ -1250,33 +1473,26 @@ class TSPClusteringApp:
             service_time_hours = 1.0
             work_hours = 8.0
         
-        # Get customers in this region
-        region_mask = self.labels == (region_num - 1)  # labels are 0-indexed
-        region_customer_indices = np.where(region_mask)[0]
-        
-        if len(region_customer_indices) == 0:
-            return 1
-        
-        # Map to driving matrix indices
-        matrix_indices = []
-        for customer_idx in region_customer_indices:
-            postcode = self.customer_postcodes[customer_idx]
-            if postcode in self.customer_postcode_to_idx:
-                matrix_indices.append(self.customer_postcode_to_idx[postcode])
+        if matrix_indices is None:
+            # Get customers in this region
+            region_customer_indices = np.flatnonzero(self.labels == (region_num - 1))  # labels are 0-indexed
+            
+            # Map to driving matrix indices
+            matrix_indices = np.array([self.customer_postcode_to_idx.get(self.customer_postcodes[customer_idx], -1)
+                                       for customer_idx in region_customer_indices], dtype=np.intp)
+            matrix_indices = matrix_indices[matrix_indices >= 0]  # -1 = no driving times for this customer
         
         if len(matrix_indices) == 0:
             return 1
         
-        # Use nearest neighbor to get approximate tour through all customers
+        # Approximate a tour through all customers
         # Start from depot, visit all customers, return to depot
         tour_time_minutes = 0
         
         # Travel from depot to nearest customer
-        min_depot_distance = np.inf
-        for idx in matrix_indices:
-            dist = self.driving_time_matrix[self.depot_postcode_idx, idx]
-            if not np.isinf(dist) and dist < min_depot_distance:
-                min_depot_distance = dist
+        depot_distances = self.driving_time_matrix[self.depot_postcode_idx, matrix_indices]
+        depot_distances = depot_distances[np.isfinite(depot_distances)]
+        min_depot_distance = float(depot_distances.min()) if len(depot_distances) > 0 else np.inf
         
         # If no valid distances found, use a default estimate
         if np.isinf(min_depot_distance):
@@ -1289,25 +1505,17 @@ class TSPClusteringApp:
         
         tour_time_minutes += min_depot_distance
         
-        # Travel between customers using nearest neighbor approximation
-        # For a more accurate estimate of total tour time
+        # Travel between customers, estimated from a minimum spanning tree of the region
         if len(matrix_indices) > 1:
-            # Calculate average pairwise distance within region (excluding infinities)
-            total_intra_distance = 0
-            count = 0
-            for i in matrix_indices:
-                for j in matrix_indices:
-                    if i != j:
-                        dist = self.driving_time_matrix[i, j]
-                        if not np.isinf(dist):
-                            total_intra_distance += dist
-                            count += 1
-            
-            if count > 0:
-                avg_distance = total_intra_distance / count
-                # Estimate tour time as number of hops * average distance
-                # (n-1 hops between n customers)
-                tour_time_minutes += avg_distance * (len(matrix_indices) - 1)
+            region_times = self.driving_time_matrix[np.ix_(matrix_indices, matrix_indices)]
+            valid_pairs = (matrix_indices[:, None] != matrix_indices[None, :]) & np.isfinite(region_times)
+            
+            if valid_pairs.any():
+                # csgraph reads 0 as "no edge", which is what unknown (inf) pairs should be
+                region_edges = np.where(valid_pairs, region_times, 0)
+                # Walking the tree there and back visits every customer and is at most twice the
+                # optimal tour (the double-MST bound), without the O(n^2) average over all pairs
+                tour_time_minutes += 2 * minimum_spanning_tree(region_edges).sum()
             else:
                 # Fallback: no valid inter-customer distances
                 tour_time_minutes += min_depot_distance * len(matrix_indices)
@@ -1332,16 +1540,20 @@ class TSPClusteringApp:
     
     def _add_region_labels_with_overlap_prevention(self, ax, coords, customer_postcodes, depot):
         """Add region labels with simple overlap prevention"""
-        # Collect all existing label positions (customers + depot)
-        occupied_positions = []
+        if not self._region_labels_to_draw:
+            return  # No regions to label (e.g. every location excluded), so no positions to index
         
-        # Add customer positions
-        for coord in coords:
-            occupied_positions.append((coord[1], coord[0]))
+        # Existing label positions as (lon, lat) rows: customers, the depot, then each region label
+        # as it is placed. Allocated once for all of them; only the first n_occupied rows are in use
+        occupied_buffer = np.empty((len(coords) + 1 + len(self._region_labels_to_draw), 2))
+        occupied_buffer[:len(coords)] = coords[:, ::-1]
+        occupied_buffer[len(coords)] = depot[0, ::-1]
+        n_occupied = len(coords) + 1
         
-        # Add depot position
-        occupied_positions.append((depot[0, 1], depot[0, 0]))        # Convert to numpy array for easier distance calculations
-        occupied_positions = np.array(occupied_positions)
+        # Spatial index over the fixed customer and depot labels; the few region labels placed
+        # so far are checked directly (see get_nearest_label_distances_sq)
+        label_tree = cKDTree(occupied_buffer[:n_occupied])
+        n_fixed = n_occupied
         
         # Get plot limits to constrain label positions
         xlim = ax.get_xlim()
@@ -1353,34 +1565,23 @@ class TSPClusteringApp:
             best_lat = region_info['lat']
             
             # Check if centroid position overlaps with existing labels
+            placed_labels = occupied_buffer[n_fixed:n_occupied]
             centroid_pos = np.array([best_lon, best_lat])
-            distances = np.sqrt(np.sum((occupied_positions - centroid_pos)**2, axis=1))
+            min_distance_sq = self.get_nearest_label_distances_sq(centroid_pos[None, :], label_tree, placed_labels)[0]
             
             # If too close to any existing label, try to find a better position
             min_distance_threshold = 0.005  # Adjust based on your coordinate scale
-            if np.min(distances) < min_distance_threshold:
-                # Try offsetting in various directions
-                offsets = [
-                    (0.01, 0.01), (-0.01, 0.01), (0.01, -0.01), (-0.01, -0.01),
-                    (0.015, 0), (-0.015, 0), (0, 0.015), (0, -0.015),
-                    (0.02, 0.01), (-0.02, -0.01), (0.01, 0.02), (-0.01, -0.02)
-                ]
-                
-                best_distance = np.min(distances)
-                for offset_lon, offset_lat in offsets:
-                    test_lon = region_info['lon'] + offset_lon
-                    test_lat = region_info['lat'] + offset_lat
-                    
-                    # Check if within plot bounds
-                    if xlim[0] <= test_lon <= xlim[1] and ylim[0] <= test_lat <= ylim[1]:
-                        test_pos = np.array([test_lon, test_lat])
-                        test_distances = np.sqrt(np.sum((occupied_positions - test_pos)**2, axis=1))
-                        min_test_dist = np.min(test_distances)
-                        
-                        if min_test_dist > best_distance:
-                            best_distance = min_test_dist
-                            best_lon = test_lon
-                            best_lat = test_lat
+            if min_distance_sq < min_distance_threshold ** 2:  # Compared squared, no sqrt needed
+                # Try offsetting in various directions: score the centroid (row 0) and every offset position
+                # at once by squared distance to the nearest existing label; argmax keeps the first furthest,
+                # so an offset must be strictly further away than the centroid and every earlier offset to win
+                positions = centroid_pos + REGION_LABEL_OFFSETS
+                min_dists_sq = self.get_nearest_label_distances_sq(positions, label_tree, placed_labels)
+                in_bounds = ((xlim[0] <= positions[:, 0]) & (positions[:, 0] <= xlim[1]) &
+                             (ylim[0] <= positions[:, 1]) & (positions[:, 1] <= ylim[1]))
+                in_bounds[0] = True
+                min_dists_sq[~in_bounds] = -np.inf
+                best_lon, best_lat = positions[min_dists_sq.argmax()]
             
             # Draw the region label at the best position found
             ax.annotate(region_info['text'],
@@ -1398,44 +1599,98 @@ class TSPClusteringApp:
                        zorder=20)
             
             # Add this position to occupied positions for next iteration
-            occupied_positions = np.vstack([occupied_positions, [best_lon, best_lat]])
+            occupied_buffer[n_occupied] = (best_lon, best_lat)
+            n_occupied += 1
         
         # Clear the stored labels
         self._region_labels_to_draw = []
-            
+    
+    def get_nearest_label_distances_sq(self, positions, label_tree, placed_labels):
+        """Squared distance from each (lon, lat) row of positions to the nearest customer/depot
+        label in label_tree (a cKDTree) or region label in placed_labels"""
+        _, nearest = label_tree.query(positions)
+        offsets = positions - label_tree.data[nearest]
+        distances_sq = np.einsum('ij,ij->i', offsets, offsets)  # Row-wise sum of squares without a squared copy
+        if len(placed_labels) > 0:
+            distances_sq = np.minimum(distances_sq, cdist(positions, placed_labels, 'sqeuclidean').min(axis=1))
+        return distances_sq
+            
+    def get_region_hull_edges(self, coords, region_indices):
+        """Return the convex hull edges of coords[region_indices] as (k, 2) positions into
+        region_indices, or None when there are too few points or they lie on a line.
+        Memoized per region membership, so redraws after an edit only recompute changed regions."""
+        if self.hull_cache_coords is not coords:
+            self.hull_cache = {}
+            self.hull_cache_coords = coords
+        
+        key = region_indices.tobytes()
+        if key not in self.hull_cache:
+            points = coords[region_indices]
+            hull_edges = None
+            if len(points) >= 3 and np.ptp(points, axis=0).min() > HULL_MIN_SPAN_DEGREES:
+                try:
+                    hull_edges = ConvexHull(points).simplices
+                except Exception:
+                    pass  # Collinear points that aren't axis-aligned
+            self.hull_cache[key] = hull_edges
+        
+        return self.hull_cache[key]
+    
     def create_visualization(self, coords, labels, depot, n_clusters, customer_postcodes, customer_names, depot_postcode):
         """Create visualization of clusters with postcode labels embedded in GUI"""
         # Initialize region labels list
         self._region_labels_to_draw = []
         
-        # Clear any existing content in viz frame
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-        
-        # Ensure viz frame is visible
-        self.viz_frame.grid_rowconfigure(0, weight=1)
-        self.viz_frame.grid_columnconfigure(0, weight=1)
-        
-        # Create container for canvas
-        self.viz_canvas_container = ttk.Frame(self.viz_frame)
-        self.viz_canvas_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Redraw into the existing figure when the cluster map is already shown (region edits,
+        # renames, display toggle) instead of rebuilding the Tk canvas and toolbar each time
+        reuse_canvas = (self.cluster_figure is not None and self.canvas is not None
+                        and self.canvas.figure is self.cluster_figure
+                        and self.canvas.get_tk_widget().winfo_exists())
         
-        # Create figure
-        fig = Figure(figsize=(12, 8), dpi=100)
+        if reuse_canvas:
+            fig = self.cluster_figure
+            fig.clear()
+        else:
+            # Clear any existing content in viz frame
+            for widget in self.viz_frame.winfo_children():
+                widget.destroy()
+            
+            # Ensure viz frame is visible
+            self.viz_frame.grid_rowconfigure(0, weight=1)
+            self.viz_frame.grid_columnconfigure(0, weight=1)
+            
+            # Create container for canvas
+            self.viz_canvas_container = ttk.Frame(self.viz_frame)
+            self.viz_canvas_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            
+            # Create figure
+            fig = Figure(figsize=(12, 8), dpi=100)
         ax = fig.add_subplot(111)
         
         # Build color list from region colors (use Outlook colors if available)
-        colors = []
-        for i in range(n_clusters):
-            region_num = i + 1
-            color_code = self.region_colors.get(region_num, 1)  # Default to Red
-            matplotlib_color = self.outlook_color_to_matplotlib(color_code)
-            colors.append(matplotlib_color)
+        colors = [self.outlook_color_to_matplotlib(self.region_colors.get(i + 1, 1))  # Default to Red
+                  for i in range(n_clusters)]
+        
+        # Region sizes and centroids from one pass over the labels (excluded locations are -1)
+        region_labels = labels[labels >= 0]
+        region_sizes = np.bincount(region_labels, minlength=n_clusters)
+        region_coords = coords[labels >= 0]
+        with np.errstate(invalid='ignore', divide='ignore'):  # Empty regions get no centroid and are skipped
+            region_centroids = np.column_stack([
+                np.bincount(region_labels, weights=region_coords[:, 0], minlength=n_clusters),
+                np.bincount(region_labels, weights=region_coords[:, 1], minlength=n_clusters)]) / region_sizes[:, None]
+        
+        # Location indices of each region from one stable sort, instead of a labels == i mask per region
+        # (excluded locations are -1 so sort first; indices stay ascending within each region)
+        label_order = np.argsort(labels, kind='stable')
+        n_excluded = len(labels) - len(region_labels)
+        excluded_indices = label_order[:n_excluded]
+        region_members = np.split(label_order[n_excluded:], np.cumsum(region_sizes)[:-1])
         
         # Plot clusters
         for i in range(n_clusters):
-            cluster_mask = labels == i
-            cluster_coords = coords[cluster_mask]
+            member_indices = region_members[i]
+            cluster_coords = coords[member_indices]
             
             if len(cluster_coords) > 0:
                 # Get custom name if available
@@ -1444,21 +1699,19 @@ class TSPClusteringApp:
                 ax.scatter(cluster_coords[:, 1], cluster_coords[:, 0], 
                           c=colors[i], s=100, alpha=0.6, 
                           edgecolors='black', linewidth=1,
-                          label=f'{region_name} ({np.sum(cluster_mask)} locations)')
+                          label=f'{region_name} ({region_sizes[i]} locations)')
                 
-                # Draw convex hull if possible
-                if len(cluster_coords) >= 3:
-                    try:
-                        hull = ConvexHull(cluster_coords)
-                        for simplex in hull.simplices:
-                            ax.plot(cluster_coords[simplex, 1], cluster_coords[simplex, 0], 
-                                   colors[i], linewidth=2, alpha=0.5)
-                    except:
-                        pass
+                # Draw convex hull if possible (all edges as one NaN-separated line)
+                hull_edges = self.get_region_hull_edges(coords, member_indices)
+                if hull_edges is not None:
+                    segments = np.full((len(hull_edges), 3, 2), np.nan)
+                    segments[:, :2] = cluster_coords[hull_edges]
+                    segments = segments.reshape(-1, 2)
+                    ax.plot(segments[:, 1], segments[:, 0], 
+                           colors[i], linewidth=2, alpha=0.5)
                 
                 # Add region name label at centroid (store for overlap prevention)
-                centroid_lon = cluster_coords[:, 1].mean()
-                centroid_lat = cluster_coords[:, 0].mean()
+                centroid_lat, centroid_lon = region_centroids[i]
                 
                 # Store region label info for later (after all customer labels)
                 self._region_labels_to_draw.append({
@@ -1469,18 +1722,25 @@ class TSPClusteringApp:
                 })
         
         # Plot excluded locations (region = -1)
-        excluded_mask = labels == -1
-        excluded_coords = coords[excluded_mask]
+        excluded_coords = coords[excluded_indices]
         if len(excluded_coords) > 0:
             ax.scatter(excluded_coords[:, 1], excluded_coords[:, 0], 
                       c='lightgray', s=150, alpha=0.6, 
                       edgecolors='red', linewidth=2,
                       marker='D',
-                      label=f'Excluded ({np.sum(excluded_mask)} locations)')
+                      label=f'Excluded ({n_excluded} locations)')
         
         # Add postcode labels for customer locations
         show_names = get_show_names()
-        for idx, (coord, postcode) in enumerate(zip(coords, customer_postcodes)):
+        
+        # Different styling for excluded postcodes (matplotlib copies the bbox props, so one dict per style is shared)
+        excluded_bbox_style = dict(boxstyle='round,pad=0.3', facecolor='lightgray', 
+                                   edgecolor='red', alpha=0.7, linestyle='--', linewidth=1.5)
+        region_bbox_style = dict(boxstyle='round,pad=0.3', facecolor='white', 
+                                 edgecolor='gray', alpha=0.7)
+        excluded_flags = (labels == -1).tolist()
+        
+        for idx, (lat, lon, postcode) in enumerate(zip(coords[:, 0].tolist(), coords[:, 1].tolist(), customer_postcodes)):
             # Determine what to display
             customer_name = customer_names[idx] if idx < len(customer_names) else None
             if show_names and customer_name:
@@ -1488,21 +1748,13 @@ class TSPClusteringApp:
             else:
                 display_text = postcode
             
-            # Different styling for excluded postcodes
-            if labels[idx] == -1:
-                bbox_style = dict(boxstyle='round,pad=0.3', facecolor='lightgray', 
-                                edgecolor='red', alpha=0.7, linestyle='--', linewidth=1.5)
-            else:
-                bbox_style = dict(boxstyle='round,pad=0.3', facecolor='white', 
-                                edgecolor='gray', alpha=0.7)
-            
             ax.annotate(display_text, 
-                       xy=(coord[1], coord[0]),
+                       xy=(lon, lat),
                        xytext=(3, 3),  # Offset by 3 points
                        textcoords='offset points',
                        fontsize=7,
                        fontweight='bold',
-                       bbox=bbox_style,
+                       bbox=excluded_bbox_style if excluded_flags[idx] else region_bbox_style,
                        zorder=10)
         
         # Plot depot
@@ -1533,6 +1785,12 @@ class TSPClusteringApp:
         
         fig.tight_layout()
         
+        if reuse_canvas:
+            # Zoom/pan history refers to the old axes, so start it afresh
+            self.toolbar.update()
+            self.canvas.draw_idle()
+            return
+        
         # Embed in tkinter
         canvas = FigureCanvasTkAgg(fig, master=self.viz_canvas_container)
         canvas.draw()
@@ -1545,6 +1803,7 @@ class TSPClusteringApp:
         
         self.canvas = canvas
         self.toolbar = toolbar
+        self.cluster_figure = fig
     
     def create_initial_visualization(self, coords, depot, postcodes, depot_postcode):
         """Create initial visualization showing all locations before clustering"""
@@ -1670,9 +1929,7 @@ class TSPClusteringApp:
         def on_postcode_selected(event):
             selected = postcode_var.get()
             if selected:
-                current_region = self.clustered_results[
-                    self.clustered_results['postcode'] == selected
-                ]['region'].iloc[0]
+                current_region = self.clustered_results.at[self.clustered_results_rows[selected], 'region']
                 if current_region == -1:
                     current_region_var.set("Excluded")
                 else:
@@ -1687,7 +1944,7 @@ class TSPClusteringApp:
         ttk.Label(region_frame, text="New Region:", font=('Arial', 10)).pack(side=tk.LEFT, padx=(0, 10))
         
         # Region options: 1 to n_clusters, plus "Create New Region" and "Exclude"
-        region_options = [f"Region {i+1}" for i in range(self.n_clusters)] + [f"Create New Region {self.n_clusters + 1}"] + ["Exclude from all regions"]
+        region_options = self.get_edit_region_options()
         new_region_var = tk.StringVar()
         region_combo = ttk.Combobox(region_frame, textvariable=new_region_var, 
                                    values=region_options, state='readonly', width=30)
@@ -1722,21 +1979,17 @@ class TSPClusteringApp:
                 region_display = new_region_str
             
             # Get current region
-            current_region = self.clustered_results[
-                self.clustered_results['postcode'] == selected_postcode
-            ]['region'].iloc[0]
+            current_region = self.clustered_results.at[self.clustered_results_rows[selected_postcode], 'region']
             
             if current_region == new_region:
                 messagebox.showinfo("No Change", f"{selected_postcode} is already in {region_display}.")
                 return
             
             # Update the region in clustered_results
-            self.clustered_results.loc[
-                self.clustered_results['postcode'] == selected_postcode, 'region'
-            ] = new_region
+            self.clustered_results.at[self.clustered_results_rows[selected_postcode], 'region'] = new_region
             
             # Update the labels array for visualization
-            postcode_idx = self.customer_postcodes.index(selected_postcode)
+            postcode_idx = self.customer_postcode_positions[selected_postcode]
             if new_region == -1:
                 # For excluded, we'll use a special value
                 self.labels[postcode_idx] = -1
@@ -1760,9 +2013,9 @@ class TSPClusteringApp:
             # Update current region display
             current_region_var.set(region_display)
             
-            # Update the region dropdown to include any newly created regions
-            region_options = [f"Region {i+1}" for i in range(self.n_clusters)] + [f"Create New Region {self.n_clusters + 1}"] + ["Exclude from all regions"]
-            region_combo.config(values=region_options)
+            # Update the region dropdown to include a newly created region (other edits leave it unchanged)
+            if new_region_str.startswith("Create New Region"):
+                region_combo.config(values=self.get_edit_region_options())
         
         apply_frame = ttk.Frame(frame)
         apply_frame.pack(pady=20)
@@ -1777,24 +2030,30 @@ class TSPClusteringApp:
                              font=('Arial', 8), foreground='gray', justify=tk.CENTER)
         info_text.pack(pady=(20, 0))
     
+    def get_edit_region_options(self):
+        """Region options for the edit dialog: 1 to n_clusters, plus Create New Region and Exclude"""
+        return [f"Region {i+1}" for i in range(self.n_clusters)] + [f"Create New Region {self.n_clusters + 1}"] + ["Exclude from all regions"]
+    
     def update_summary_results(self):
         """Update the summary results after manual edits"""
+        self.summary_results = self.build_region_summary(self.clustered_results, self.n_clusters)
+    
+    def build_region_summary(self, results_df, n_clusters):
+        """Build the region summary (region, customer_count, postcodes) from region assignments"""
+        # One groupby pass instead of a boolean scan of results_df per region
+        region_postcodes = results_df.groupby('region', sort=True)['postcode'].agg(list)  # {region: [postcodes]}
+        
         summary = []
-        for i in range(self.n_clusters):
-            region_postcodes = self.clustered_results[
-                self.clustered_results['region'] == i+1
-            ]['postcode'].tolist()
+        for i in range(n_clusters):
+            postcodes = region_postcodes.get(i+1, [])
             summary.append({
                 'region': i+1,
-                'customer_count': len(region_postcodes),
-                'postcodes': ', '.join(region_postcodes)
+                'customer_count': len(postcodes),
+                'postcodes': ', '.join(postcodes)
             })
         
-        # Add excluded locations if any
-        excluded_postcodes = self.clustered_results[
-            self.clustered_results['region'] == -1
-        ]['postcode'].tolist()
-        
+        # Add excluded locations if any (region -1 is just another group)
+        excluded_postcodes = region_postcodes.get(-1, [])
         if excluded_postcodes:
             summary.append({
                 'region': 'Excluded',
@@ -1802,7 +2061,7 @@ class TSPClusteringApp:
                 'postcodes': ', '.join(excluded_postcodes)
             })
         
-        self.summary_results = pd.DataFrame(summary)
+        return pd.DataFrame(summary)
     
     def refresh_visualization(self):
         """Refresh the visualization after manual edits"""
@@ -1951,56 +2210,38 @@ class TSPClusteringApp:
             return
         
         try:
-            df = pd.read_csv(names_file)
-            self.region_names = {}
+            columns, rows = self.read_region_names_csv(names_file)
             self.region_colors = {}
             
-            for _, row in df.iterrows():
-                region_num = int(row['region'])
-                self.region_names[region_num] = row['name']
-                
-                # Load color code if available
-                if 'color_code' in df.columns:
-                    self.region_colors[region_num] = int(row['color_code'])
+            # Region names from the rows (a blank name falls back to "Region N")
+            self.region_names = {int(row['region']): row['name'] for row in rows if row['name']}
+            
+            # Load color codes if available
+            if 'color_code' in columns:
+                self.region_colors = {int(row['region']): int(row['color_code']) for row in rows}
             
             self.log(f"✓ Loaded {len(self.region_names)} region names and colors")
         except Exception as e:
             self.log(f"⚠ Failed to load region names: {e}")
     
+    def read_region_names_csv(self, names_file):
+        """Read region_names.csv as (column names, rows as dicts of strings) with the csv module,
+        as it only holds a few short rows (utf-8-sig also accepts a BOM left by spreadsheet editors).
+        The result is reused until the file changes; callers must not modify it"""
+        source = self.get_file_source(names_file)
+        if self.region_names_csv_cache is None or self.region_names_csv_cache[0] != source:
+            with open(names_file, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                self.region_names_csv_cache = (source, reader.fieldnames or [], list(reader))
+        return self.region_names_csv_cache[1:]
+    
     def get_region_display_name(self, region_num):
         """Get display name for a region (custom name or default)"""
         return self.region_names.get(region_num, f"Region {region_num}")
     
     def outlook_color_to_matplotlib(self, color_code):
         """Convert Outlook color code to matplotlib RGB color"""
-        # Approximate mapping of Outlook colors to RGB hex values
-        color_map = {
-            1: '#DC143C',   # Red
-            2: '#FF8C00',   # Orange
-            3: '#FFB6C1',   # Peach
-            4: '#FFD700',   # Yellow
-            5: '#32CD32',   # Green
-            6: '#008B8B',   # Teal
-            7: '#808000',   # Olive
-            8: '#4169E1',   # Blue
-            9: '#9370DB',   # Purple
-            10: '#800000',  # Maroon
-            11: '#4682B4',  # Steel
-            12: '#36454F',  # DarkSteel
-            13: '#808080',  # Gray
-            14: '#696969',  # DarkGray
-            15: '#000000',  # Black
-            16: '#8B0000',  # DarkRed
-            17: '#FF4500',  # DarkOrange
-            18: '#CD5C5C',  # DarkPeach
-            19: '#DAA520',  # DarkYellow
-            20: '#006400',  # DarkGreen
-            21: '#008080',  # DarkTeal
-            22: '#556B2F',  # DarkOlive
-            23: '#00008B',  # DarkBlue
-            24: '#483D8B',  # DarkPurple
-        }
-        return color_map.get(color_code, '#DC143C')  # Default to Red
+        return OUTLOOK_COLOR_HEX.get(color_code, '#DC143C')  # Default to Red
     
     def auto_assign_default_colors(self):
         """Auto-assign default Outlook colors to regions (starting from 1: Red)"""
@@ -2032,23 +2273,32 @@ class TSPClusteringApp:
             # Only use regions from current clustering (1 to n_clusters)
             # This prevents stale data from previous runs with more regions
             if self.n_clusters:
-                all_regions = set(range(1, self.n_clusters + 1))
+                all_regions = range(1, self.n_clusters + 1)  # Already in order
             else:
                 # Fallback to dictionary keys if n_clusters not set
-                all_regions = set(self.region_names.keys()) | set(self.region_colors.keys())
+                all_regions = sorted(set(self.region_names.keys()) | set(self.region_colors.keys()))
             
-            for region in sorted(all_regions):
+            for region in all_regions:
                 name = self.region_names.get(region, f"Region {region}")
                 color = self.region_colors.get(region, 1)  # Default to Red (1)
-                data.append({
-                    'region': region,
-                    'name': name,
-                    'color_code': color
-                })
+                data.append((region, name, color))
+            
+            # Nothing to write if the file is untouched since it was saved with exactly these rows (e.g. auto-assign
+            # found every color set); an edit made outside the app changes its source, so the file is rewritten
+            if (self.region_names_saved is not None and self.region_names_saved[1] == data
+                    and os.path.exists(names_file)
+                    and self.get_file_source(names_file) == self.region_names_saved[0]):
+                return
             
             if data:
-                df = pd.DataFrame(data)
-                df.to_csv(names_file, index=False)
+                # A few short rows, so write them directly rather than through a DataFrame
+                with open(names_file, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(REGION_NAMES_CSV_COLUMNS)
+                    writer.writerows(data)
+                self.region_names_saved = (self.get_file_source(names_file), data)
+                # The file was just rewritten, so read it afresh next time (its mtime and size may not have changed)
+                self.region_names_csv_cache = None
                 self.log(f"✓ Saved region names and colors to region_names.csv")
             elif os.path.exists(names_file):
                 # Remove file if no data
@@ -2066,15 +2316,12 @@ class TSPClusteringApp:
             return
         
         try:
-            df = pd.read_csv(names_file)
+            columns, rows = self.read_region_names_csv(names_file)
             self.region_colors = {}
             
             # Check if color_code column exists
-            if 'color_code' in df.columns:
-                for _, row in df.iterrows():
-                    region_num = int(row['region'])
-                    color_code = int(row['color_code'])
-                    self.region_colors[region_num] = color_code
+            if 'color_code' in columns:
+                self.region_colors = {int(row['region']): int(row['color_code']) for row in rows}
                 self.log(f"✓ Loaded color codes for {len(self.region_colors)} regions")
             else:
                 self.log("⚠ No color codes found in region_names.csv")
@@ -2090,6 +2337,11 @@ def main():
             print(f"Warning: Project directory not found: {project_dir}")
             project_dir = None
     
+    # Without a display (e.g. a headless Linux session) Tk can't open a window, so stop before creating one
+    if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        print("Error: No display available - the TSP Regional Clustering Optimizer needs a graphical desktop")
+        sys.exit(1)
+    
     root = tk.Tk()
     app = TSPClusteringApp(root, project_dir=project_dir)
     root.mainloop()